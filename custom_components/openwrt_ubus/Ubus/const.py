@@ -5,6 +5,7 @@ API_DEF_DEBUG = True
 API_DEF_SESSION_ID = "00000000000000000000000000000000"
 API_DEF_TIMEOUT = 15
 API_DEF_VERIFY = False
+API_BATCH_SIZE = 20  # Maximum calls sent in one JSON-RPC batch request
 
 API_ERROR = "error"
 API_MESSAGE = "message"
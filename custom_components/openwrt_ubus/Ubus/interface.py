@@ -1,13 +1,16 @@
 """Client for the OpenWrt ubus API."""
 
+import asyncio
 import json
 import logging
 import time
 from typing import Any
 
 import aiohttp
+import orjson
 
 from .const import (
+    API_BATCH_SIZE,
     API_DEF_DEBUG,
     API_DEF_SESSION_ID,
     API_DEF_TIMEOUT,
@@ -33,6 +36,12 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+def _consume_task_result(task: asyncio.Task) -> None:
+    """Mark the outcome of a shared call as retrieved, its callers re-raise it themselves."""
+    if not task.cancelled():
+        task.exception()
+
+
 class Ubus:
     """Interacts with the OpenWrt ubus API."""
 
@@ -58,6 +67,8 @@ class Ubus:
         self.session_id = None
         self.session_expire = 0
         self._session_created_internally = False
+        # Tasks of identical calls currently on the wire, keyed by call signature
+        self._inflight: dict[tuple, asyncio.Task] = {}
 
     def set_session(self, session):
         """Set the aiohttp session to use."""
@@ -118,6 +129,40 @@ class Ubus:
         return data
 
     async def batch_call(self, rpcs: list[dict]):
+        """Execute multiple API calls in as few batch requests as possible.
+
+        Calls are sent in batches of at most API_BATCH_SIZE, the responses are
+        returned in the order of the calls.
+        """
+        self._ensure_session()
+        await self._ensure_session_is_valid()
+
+        if len(rpcs) <= API_BATCH_SIZE:
+            return self._order_batch_responses(rpcs, await self._batch_call(rpcs))
+
+        chunk_results = await asyncio.gather(*(
+            self._batch_call(rpcs[start:start + API_BATCH_SIZE])
+            for start in range(0, len(rpcs), API_BATCH_SIZE)
+        ))
+        if any(result is None for result in chunk_results):
+            return None
+        return self._order_batch_responses(rpcs, [response for result in chunk_results for response in result])
+
+    @staticmethod
+    def _order_batch_responses(rpcs: list[dict], responses):
+        """Sort batch responses into the order of their calls by JSON-RPC id."""
+        if not responses:
+            return responses
+
+        position = {rpc.get("id"): index for index, rpc in enumerate(rpcs)}
+        # Leave the responses alone if they can't be matched to their calls
+        if len(position) != len(rpcs) or not all(
+            isinstance(response, dict) and response.get("id") in position for response in responses
+        ):
+            return responses
+        return sorted(responses, key=lambda response: position[response["id"]])
+
+    async def _batch_call(self, rpcs: list[dict]):
         """Execute multiple API calls in a single batch request."""
         self._ensure_session()
         await self._ensure_session_is_valid()
@@ -129,14 +174,22 @@ class Ubus:
             response = await self.session.post(
                 self.host, data=json.dumps(rpcs), timeout=self.timeout, verify_ssl=self.verify
             )
+        except aiohttp.ClientConnectionError as conn_exc:
+            # The router dropped the connection, log in again on the next call
+            _LOGGER.error("batch_call exception: %s", conn_exc)
+            self.logout()
+            return None
         except aiohttp.ClientError as req_exc:
             _LOGGER.error("batch_call exception: %s", req_exc)
             return None
 
         if response.status != HTTP_STATUS_OK:
+            # Return the connection to the pool, the body is not read
+            response.release()
             return None
 
-        json_response = await response.json()
+        # orjson parses the raw body directly, without decoding it to str first
+        json_response = orjson.loads(await response.read())
 
         if self.debug_api:
             _LOGGER.debug(
@@ -194,9 +247,37 @@ class Ubus:
             method: str | None = None,
             params: dict | None = None,
     ):
-        """Perform API call."""
-        await self._ensure_session_is_valid()
-        return await self._api_call(rpc_method, subsystem, method, params)
+        """Perform API call.
+
+        Identical calls issued while one is already in flight share its result
+        instead of sending a second request to the router.
+        """
+        key = (rpc_method, subsystem, method, json.dumps(params, sort_keys=True) if params else None)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._shared_api_call(key, rpc_method, subsystem, method, params))
+            # Retrieve the outcome even if every caller was cancelled meanwhile
+            task.add_done_callback(_consume_task_result)
+            self._inflight[key] = task
+
+        # The call runs in its own task, so cancelling one caller, the first one
+        # included, does not cancel it for the others
+        return await asyncio.shield(task)
+
+    async def _shared_api_call(
+            self,
+            key: tuple,
+            rpc_method: str,
+            subsystem: str | None,
+            method: str | None,
+            params: dict | None,
+    ):
+        """Perform the API call shared by all identical concurrent callers."""
+        try:
+            await self._ensure_session_is_valid()
+            return await self._api_call(rpc_method, subsystem, method, params)
+        finally:
+            del self._inflight[key]
 
     async def _api_call(
             self,
@@ -241,14 +322,22 @@ class Ubus:
             response = await self.session.post(
                 self.host, data=data, timeout=self.timeout, verify_ssl=self.verify
             )
+        except aiohttp.ClientConnectionError as conn_exc:
+            # The router dropped the connection, log in again on the next call
+            _LOGGER.error("api_call exception: %s", conn_exc)
+            self.logout()
+            return None
         except aiohttp.ClientError as req_exc:
             _LOGGER.error("api_call exception: %s", req_exc)
             return None
 
         if response.status != HTTP_STATUS_OK:
+            # Return the connection to the pool, the body is not read
+            response.release()
             return None
 
-        json_response = await response.json()
+        # orjson parses the raw body directly, without decoding it to str first
+        json_response = orjson.loads(await response.read())
 
         if self.debug_api:
             _LOGGER.debug(
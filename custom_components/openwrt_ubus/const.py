@@ -50,6 +50,12 @@ DEFAULT_STA_SENSOR_TIMEOUT = 30
 DEFAULT_AP_SENSOR_TIMEOUT = 60
 DEFAULT_SERVICE_TIMEOUT = 30
 
+# Router HTTP connection pool, idle connections are kept open across polls.
+# Chunked batch calls run concurrently, so allow enough connections per host
+# for them not to queue behind each other.
+API_KEEPALIVE_TIMEOUT = 180
+API_CONNECTIONS_PER_HOST = 8
+
 # API constants - moved from Ubus/const.py
 API_RPC_CALL = "call"
 API_RPC_LIST = "list"
@@ -79,6 +85,7 @@ API_METHOD_GET_STA = "assoclist"
 API_METHOD_GET_QMODEM = "info"
 API_METHOD_INFO = "info"
 API_METHOD_READ = "read"
+API_METHOD_EXEC = "exec"
 API_METHOD_REBOOT = "reboot"
 API_METHOD_DEL_CLIENT = "del_client"
 API_METHOD_LIST = "list"
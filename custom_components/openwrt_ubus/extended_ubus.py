@@ -1,9 +1,20 @@
 """Extended Ubus client with specific OpenWrt functionality."""
 
+import asyncio
 import json
 import logging
+from contextlib import suppress
+
+import aiohttp
 
 from .Ubus import Ubus
+from .Ubus.const import (
+    UBUS_ERROR_METHOD_NOT_FOUND,
+    UBUS_ERROR_NOT_FOUND,
+    UBUS_ERROR_NOT_SUPPORTED,
+    UBUS_ERROR_PERMISSION_DENIED,
+    UBUS_ERROR_SUCCESS,
+)
 from .const import (
     API_RPC_CALL,
     API_RPC_LIST,
@@ -27,6 +38,7 @@ from .const import (
     API_METHOD_GET_QMODEM,
     API_METHOD_INFO,
     API_METHOD_READ,
+    API_METHOD_EXEC,
     API_METHOD_REBOOT,
     API_METHOD_DEL_CLIENT,
     API_METHOD_LIST,
@@ -37,6 +49,37 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Errors a ubus call and the parsing of its result can raise. OSError covers the
+# PermissionError/ConnectionError raised by Ubus for ubus level errors.
+_UBUS_CALL_ERRORS = (
+    aiohttp.ClientError,
+    asyncio.TimeoutError,
+    OSError,
+    ValueError,
+    KeyError,
+    TypeError,
+    AttributeError,
+)
+
+# Service states reported as text that mean the service is running
+_RUNNING_STATES = frozenset({"running", "active", "started"})
+
+# ubus statuses of a file exec call that mean the router will never allow it
+_FILE_EXEC_REFUSED = frozenset({
+    UBUS_ERROR_METHOD_NOT_FOUND,
+    UBUS_ERROR_NOT_FOUND,
+    UBUS_ERROR_PERMISSION_DENIED,
+    UBUS_ERROR_NOT_SUPPORTED,
+})
+
+# Shell loop printing "<hwmon dir>\t<name>\t<temp1_input>" for every hwmon device
+_HWMON_EXEC_SCRIPT = (
+    'for d in /sys/class/hwmon/*; do '
+    '[ -r "$d/temp1_input" ] || continue; '
+    'printf \'%s\\t%s\\t%s\\n\' "${d##*/}" "$(cat "$d/name" 2>/dev/null)" "$(cat "$d/temp1_input")"; '
+    'done'
+)
+
 
 class ExtendedUbus(Ubus):
     """Extended Ubus client with specific OpenWrt functionality."""
@@ -49,6 +92,7 @@ class ExtendedUbus(Ubus):
     ):
         super().__init__(host, username, password, session)
         self._interface_to_ssid_cache = {}  # Cache for interface->SSID mapping
+        self._file_exec_available = True  # Cleared once file exec is refused
 
     async def get_interface_to_ssid_mapping(self):
         """Get mapping of physical interface names to SSIDs."""
@@ -86,7 +130,7 @@ class ExtendedUbus(Ubus):
             self._interface_to_ssid_cache = mapping
             return mapping
             
-        except Exception as exc:
+        except _UBUS_CALL_ERRORS as exc:
             _LOGGER.error("Error getting interface to SSID mapping: %s", exc)
             return {}
     
@@ -104,19 +148,10 @@ class ExtendedUbus(Ubus):
     async def get_eth_sensor_coordinator(self, eth_sensor_id):
         """
         Try to get the coordinator for a given eth_sensor.
-        This is a stub for demonstration and error logging.
+        This is a stub, there is no coordinator to return.
         """
-        try:
-            # Simulate loading the eth_sensor module
-            _LOGGER.debug("Loading sensor module: eth_sensor")
-            # Simulate error accessing coordinator
-            raise KeyError(eth_sensor_id)
-        except KeyError as exc:
-            _LOGGER.error(
-                "Error accessing coordinator for eth_sensor: '%s'", eth_sensor_id
-            )
-            _LOGGER.debug("Sensor module eth_sensor returned no coordinator")
-            return None
+        _LOGGER.debug("eth_sensor coordinator lookup for %s: unimplemented stub", eth_sensor_id)
+        return None
 
     # --- END ETH SENSOR PATCH ---
 
@@ -145,7 +180,7 @@ class ExtendedUbus(Ubus):
             
             return mapping
             
-        except Exception as exc:
+        except _UBUS_CALL_ERRORS as exc:
             _LOGGER.debug("Error reading /etc/ethers: %s", exc)
             return {}
 
@@ -153,17 +188,88 @@ class ExtendedUbus(Ubus):
         """Read connection tracking count from /proc/sys/net/netfilter/nf_conntrack_count."""
         try:
             result = await self.file_read("/proc/sys/net/netfilter/nf_conntrack_count")
-            if result and "data" in result:
-                # Convert the data to an integer
+        except _UBUS_CALL_ERRORS as exc:
+            _LOGGER.debug("Error reading connection tracking count: %s", exc)
+            return None
+
+        if result and "data" in result:
+            # Convert the data to an integer
+            with suppress(ValueError, TypeError):
                 return int(result["data"].strip())
+        return None
+
+    async def _get_system_temperatures_exec(self):
+        """Read all hwmon temperatures with a single file exec call.
+
+        Returns None when file exec is not usable so the caller can fall back
+        to reading the hwmon files one by one. File exec is only switched off
+        for good when the router refuses it, not on transient failures.
+        """
+        rpc = json.loads(self.build_api(
+            API_RPC_CALL,
+            API_SUBSYS_FILE,
+            API_METHOD_EXEC,
+            {"command": "/bin/sh", "params": ["-c", _HWMON_EXEC_SCRIPT]},
+        ))
+        rpc["id"] = 0
+        # A batch call keeps the ubus status code, a plain call folds it into None
+        try:
+            responses = await self.batch_call([rpc])
+        except PermissionError as exc:
+            _LOGGER.debug("Disabling file exec hwmon readout: %s", exc)
+            self._file_exec_available = False
             return None
-        except Exception as exc:
-            _LOGGER.debug("Error reading connection tracking count: %s", exc)
+        except (ConnectionError, aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            _LOGGER.debug("file exec hwmon readout failed: %s", exc)
+            return None
+
+        if not responses or not isinstance(responses[0], dict):
+            # No answer from the router, try again on the next poll
+            return None
+
+        response = responses[0]
+        if "error" in response:
+            # rpcd rejected the call, e.g. the file object or exec method is missing
+            _LOGGER.debug("Disabling file exec hwmon readout, error: %s", response["error"])
+            self._file_exec_available = False
             return None
 
+        call_result = response.get("result")
+        if not isinstance(call_result, list) or not call_result:
+            return None
+        if call_result[0] != UBUS_ERROR_SUCCESS:
+            if call_result[0] in _FILE_EXEC_REFUSED:
+                _LOGGER.debug("Disabling file exec hwmon readout, ubus status: %s", call_result[0])
+                self._file_exec_available = False
+            return None
+
+        result = call_result[1] if len(call_result) > 1 else None
+        if not isinstance(result, dict) or result.get("code") != 0:
+            _LOGGER.debug("Disabling file exec hwmon readout, result: %s", result)
+            self._file_exec_available = False
+            return None
+
+        temperatures = {}
+        for line in result.get("stdout", "").splitlines():
+            parts = line.split("\t")
+            if len(parts) != 3:
+                continue
+            hwmon_dir, name, raw_value = parts
+            try:
+                temp_value = int(raw_value.strip()) / 1000.0
+            except ValueError:
+                continue
+            temperatures[name.strip() or f"hwmon{hwmon_dir}"] = temp_value
+        return temperatures
+
     async def get_system_temperatures(self):
         """Read system temperature sensors from /sys/class/hwmon/*/temp1_input."""
         try:
+            if self._file_exec_available:
+                temperatures = await self._get_system_temperatures_exec()
+                if temperatures is not None:
+                    return temperatures
+
             # First, list all hwmon directories
             hwmon_list_result = await self.api_call(
                 API_RPC_CALL,
@@ -187,36 +293,30 @@ class ExtendedUbus(Ubus):
                 hwmon_path = f"/sys/class/hwmon/{hwmon_dir}"
 
                 # Try to read the name file
+                name_result = await self.file_read(f"{hwmon_path}/name")
+                _LOGGER.debug("Read %s/name => %s", hwmon_path, name_result)
+                sensor_name = f"hwmon{hwmon_dir}"  # Default name based on directory
+                if name_result and "data" in name_result:
+                    sensor_name = name_result["data"].strip()
+                elif name_result is not None:
+                    _LOGGER.debug("Name result exists but no 'data' field: %s", name_result)
+
+                temp_path = f"{hwmon_path}/temp1_input"
+                temp_result = await self.file_read(temp_path)
+                _LOGGER.debug("Read %s => %s", temp_path, temp_result)
+                if not temp_result:
+                    continue
+
                 try:
-                    name_result = await self.file_read(f"{hwmon_path}/name")
-                    _LOGGER.debug("Read %s/name => %s", hwmon_path, name_result)
-                    sensor_name = f"hwmon{hwmon_dir}"  # Default name based on directory
-                    if name_result and "data" in name_result:
-                        sensor_name = name_result["data"].strip()
-                    elif name_result is not None:
-                        _LOGGER.debug("Name result exists but no 'data' field: %s", name_result)
-                        # If result is a list with error code, try to continue anyway
-                        if isinstance(name_result, list) and len(name_result) > 0:
-                            _LOGGER.debug("Name file read returned error code: %s, using default name", name_result)
-
-                    # Try multiple temperature inputs if available
-                    temp_path = f"{hwmon_path}/temp1_input"
-                    temp_result = await self.file_read(temp_path)
-                    _LOGGER.debug("Read %s => %s", temp_path, temp_result)
-                    _LOGGER.debug("Temp result type: %s", type(temp_result))
-                    if temp_result and "data" in temp_result:
-                        temp_value = int(temp_result["data"].strip()) / 1000.0
-                        temperatures[sensor_name] = temp_value
-                    elif temp_result is not None:
-                        _LOGGER.debug("Temp result exists but no 'data' field: %s", temp_result)
-
-                except (ValueError, TypeError) as exc:
+                    temp_value = int(temp_result["data"].strip()) / 1000.0
+                except (ValueError, TypeError, KeyError) as exc:
                     _LOGGER.debug("Error converting temperature value from %s: %s", temp_result, exc)
                     continue
+                temperatures[sensor_name] = temp_value
 
             return temperatures
 
-        except Exception as exc:
+        except _UBUS_CALL_ERRORS as exc:
             _LOGGER.debug("Error reading system temperatures: %s", exc)
             return {}
 
@@ -230,7 +330,7 @@ class ExtendedUbus(Ubus):
                 client_count = sum(1 for line in lines if line.strip())
                 return client_count
             return 0
-        except Exception as exc:
+        except _UBUS_CALL_ERRORS as exc:
             _LOGGER.debug("Error reading DHCP leases file: %s", exc)
             return 0
 
@@ -365,68 +465,52 @@ class ExtendedUbus(Ubus):
             _LOGGER.debug("system info raw result: %s", result)
             if result and "root" in result:
                 # Convert KB to MB
-                try:
+                with suppress(KeyError, TypeError):
                     return {
                         "total": result["root"]["total"] / 1024,
                         "free": result["root"]["free"] / 1024,
                         "used": result["root"]["used"] / 1024,
                         "avail": result["root"]["avail"] / 1024
                     }
-                except Exception as exc:
-                    _LOGGER.debug("Error parsing root partition values: %s", exc)
-                    return {"total": 0, "free": 0, "used": 0, "avail": 0}
             return {"total": 0, "free": 0, "used": 0, "avail": 0}
-        except Exception as exc:
+        except _UBUS_CALL_ERRORS as exc:
             _LOGGER.error("Failed to get root partition info: %s", exc)
             return {"total": 0, "free": 0, "used": 0, "avail": 0}
 
+    @staticmethod
+    def _sta_result_list(result):
+        """Return the device list of an iwinfo assoclist result, whatever its shape."""
+        if isinstance(result, list):
+            # Direct list format
+            return result
+        if isinstance(result, dict):
+            # Dictionary format with "results" key
+            return result.get("results", ())
+        if result:
+            _LOGGER.warning("Unexpected iwinfo station result type: %s", type(result).__name__)
+        return ()
+
     def parse_sta_devices(self, result):
         """Parse station devices from the ubus result."""
-        sta_devices = []
-        if not result:
-            return sta_devices
-
-        # Handle different response formats from iwinfo
-        if isinstance(result, list):
-            # Direct list format - normalize MAC addresses to uppercase
-            sta_devices.extend(
-                device["mac"].upper() for device in result if isinstance(device, dict) and "mac" in device
-            )
-        elif isinstance(result, dict):
-            # Dictionary format with "results" key - normalize MAC addresses to uppercase
-            sta_devices.extend(
-                device["mac"].upper() for device in result.get("results", [])
-                if isinstance(device, dict) and "mac" in device
+        # Normalize MAC addresses to uppercase for consistent lookups
+        return [
+            mac.upper()
+            for mac in (
+                device.get("mac") if isinstance(device, dict) else None
+                for device in self._sta_result_list(result)
             )
-        return sta_devices
+            if mac is not None
+        ]
 
     def parse_sta_statistics(self, result):
         """Parse detailed station statistics from the ubus result."""
         sta_statistics = {}
-        if not result:
-            return sta_statistics
-
-        # Handle different response formats from iwinfo
-        devices_list = []
-        if isinstance(result, list):
-            # Direct list format
-            devices_list = result
-        elif isinstance(result, dict):
-            # Dictionary format with "results" key
-            devices_list = result.get("results", [])
-        else:
-            _LOGGER.warning("Unexpected result type in parse_sta_statistics: %s", type(result).__name__)
-            return sta_statistics
-
         # iwinfo format - each device has detailed statistics
-        for device in devices_list:
-            if isinstance(device, dict) and "mac" in device:
+        for device in self._sta_result_list(result):
+            mac = device.get("mac") if isinstance(device, dict) else None
+            if mac is not None:
                 # Normalize MAC address to uppercase for consistent lookups
-                mac = device["mac"].upper()
-                sta_statistics[mac] = device
-            else:
-                _LOGGER.debug("Invalid device format: %s", device)
-
+                sta_statistics[mac.upper()] = device
         return sta_statistics
 
     def parse_ap_devices(self, result):
@@ -674,7 +758,8 @@ class ExtendedUbus(Ubus):
             else:
                 _LOGGER.warning("Batch call returned no results")
 
-        _LOGGER.debug("Final services with status: %s", services_with_status)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Final services with status: %s", services_with_status)
         return services_with_status
 
     def _parse_service_status(self, status_data, service_name):
@@ -688,7 +773,8 @@ class ExtendedUbus(Ubus):
         # OpenWrt RC list returns a dict with service properties:
         # {"start": 99, "enabled": true, "running": false}
         if isinstance(status_data, dict):
-            _LOGGER.debug("Service %s: Dict status keys=%s", service_name, list(status_data.keys()))
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Service %s: Dict status keys=%s", service_name, list(status_data))
 
             # Extract running and enabled status
             running = status_data.get("running", False)
@@ -709,7 +795,7 @@ class ExtendedUbus(Ubus):
 
         # Fallback for string or other formats (shouldn't happen with RC list)
         if isinstance(status_data, str):
-            running = status_data.lower() in ["running", "active", "started"]
+            running = status_data in _RUNNING_STATES or status_data.lower() in _RUNNING_STATES
             _LOGGER.debug("Service %s: String status '%s', running=%s", service_name, status_data, running)
             return {"running": running, "enabled": running, "status": status_data}
 
@@ -742,7 +828,7 @@ class ExtendedUbus(Ubus):
             _LOGGER.debug("No hostapd interfaces found in ubus list")
             return False
 
-        except Exception as exc:
+        except _UBUS_CALL_ERRORS as exc:
             _LOGGER.warning("Failed to check hostapd availability: %s", exc)
             return False
 
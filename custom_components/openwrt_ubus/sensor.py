@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import namedtuple
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.importlib import async_import_module
 
 from .const import (
     DOMAIN,
@@ -21,43 +24,35 @@ from .const import (
     DEFAULT_ENABLE_AP_SENSORS,
     DEFAULT_ENABLE_ETH_SENSORS,
 )
-from .sensors import system_sensor, qmodem_sensor, sta_sensor, ap_sensor, eth_sensor
 
 _LOGGER = logging.getLogger(__name__)
+# eth_sensor setup errors are reported on the eth_sensor module logger
+_ETH_LOGGER = logging.getLogger(f"{__package__}.sensors.eth_sensor")
 
-# Sensor modules configuration
-SENSOR_MODULES = [
-    {
-        "module": system_sensor,
-        "config_key": CONF_ENABLE_SYSTEM_SENSORS,
-        "default": DEFAULT_ENABLE_SYSTEM_SENSORS,
-        "name": "system_sensor"
-    },
-    {
-        "module": qmodem_sensor,
-        "config_key": CONF_ENABLE_QMODEM_SENSORS,
-        "default": DEFAULT_ENABLE_QMODEM_SENSORS,
-        "name": "qmodem_sensor"
-    },
-    {
-        "module": sta_sensor,
-        "config_key": CONF_ENABLE_STA_SENSORS,
-        "default": DEFAULT_ENABLE_STA_SENSORS,
-        "name": "sta_sensor"
-    },
-    {
-        "module": ap_sensor,
-        "config_key": CONF_ENABLE_AP_SENSORS,
-        "default": DEFAULT_ENABLE_AP_SENSORS,
-        "name": "ap_sensor"
-    },
-    {
-        "module": eth_sensor,
-        "config_key": CONF_ENABLE_ETH_SENSORS,
-        "default": DEFAULT_ENABLE_ETH_SENSORS,
-        "name": "eth_sensor"
-    },
-]
+# hass.data[DOMAIN] key of the coordinators to shut down on unload
+_COORDINATORS = "coordinators"
+
+SensorSpec = namedtuple("SensorSpec", "module_path config_key default name")
+
+# Sensor modules configuration, modules are only imported once enabled
+SENSOR_MODULES = (
+    SensorSpec(f"{__package__}.sensors.system_sensor", CONF_ENABLE_SYSTEM_SENSORS, DEFAULT_ENABLE_SYSTEM_SENSORS, "system_sensor"),
+    SensorSpec(f"{__package__}.sensors.qmodem_sensor", CONF_ENABLE_QMODEM_SENSORS, DEFAULT_ENABLE_QMODEM_SENSORS, "qmodem_sensor"),
+    SensorSpec(f"{__package__}.sensors.sta_sensor", CONF_ENABLE_STA_SENSORS, DEFAULT_ENABLE_STA_SENSORS, "sta_sensor"),
+    SensorSpec(f"{__package__}.sensors.ap_sensor", CONF_ENABLE_AP_SENSORS, DEFAULT_ENABLE_AP_SENSORS, "ap_sensor"),
+    SensorSpec(f"{__package__}.sensors.eth_sensor", CONF_ENABLE_ETH_SENSORS, DEFAULT_ENABLE_ETH_SENSORS, "eth_sensor"),
+)
+
+
+async def _async_setup_module(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    module_path: str,
+):
+    """Import a sensor module and run its setup."""
+    module = await async_import_module(hass, module_path)
+    return await module.async_setup_entry(hass, entry, async_add_entities)
 
 
 async def async_setup_entry(
@@ -69,13 +64,11 @@ async def async_setup_entry(
     _LOGGER.info("Setting up OpenWrt sensors")
 
     coordinators = []
+    enabled_modules = []
 
-    # Setup each sensor module based on configuration
-    for sensor_config in SENSOR_MODULES:
-        module = sensor_config["module"]
-        config_key = sensor_config["config_key"]
-        default_enabled = sensor_config["default"]
-        module_name = sensor_config["name"]
+    # Collect the sensor modules enabled in configuration
+    for sensor_spec in SENSOR_MODULES:
+        _, config_key, default_enabled, module_name = sensor_spec
 
         # Check if this sensor type is enabled
         # Priority: options > data > default
@@ -88,41 +81,41 @@ async def async_setup_entry(
             _LOGGER.info("Sensor module %s is disabled in configuration", module_name)
             continue
 
-        try:
-            # Check if module has async_setup_entry function
-            if hasattr(module, 'async_setup_entry'):
-                _LOGGER.debug("Loading sensor module: %s", module_name)
-
-                try:
-                    # Call the module's setup function
-                    coordinator = await module.async_setup_entry(hass, entry, async_add_entities)
-                except Exception as exc:
-                    # If the error is from the eth_sensor module, log with eth_sensor logger
-                    if module_name == "eth_sensor":
-                        eth_logger = logging.getLogger("custom_components.openwrt_ubus.sensors.eth_sensor")
-                        eth_logger.error("Error accessing coordinator for eth_sensor: %s", exc)
-                        eth_logger.error("eth_sensor module entry data: %s", entry.data)
-                        eth_logger.error("eth_sensor module entry options: %s", entry.options)
-                    else:
-                        _LOGGER.error("Error setting up sensor module %s: %s", module_name, exc)
-                    coordinator = None
-
-                if coordinator:
-                    coordinators.append(coordinator)
-                    _LOGGER.info("Successfully loaded sensor module: %s", module_name)
-                else:
-                    _LOGGER.debug("Sensor module %s returned no coordinator", module_name)
+        _LOGGER.debug("Loading sensor module: %s", module_name)
+        enabled_modules.append(sensor_spec)
+
+    # Set up all enabled modules concurrently so their first refreshes overlap
+    results = await asyncio.gather(
+        *(
+            _async_setup_module(hass, entry, async_add_entities, sensor_spec.module_path)
+            for sensor_spec in enabled_modules
+        ),
+        return_exceptions=True,
+    )
+
+    for sensor_spec, result in zip(enabled_modules, results):
+        module_name = sensor_spec.name
+
+        if isinstance(result, Exception):
+            # If the error is from the eth_sensor module, log with eth_sensor logger
+            if module_name == "eth_sensor":
+                _ETH_LOGGER.error("Error accessing coordinator for eth_sensor: %s", result)
+                _ETH_LOGGER.error("eth_sensor module entry data: %s", entry.data)
+                _ETH_LOGGER.error("eth_sensor module entry options: %s", entry.options)
             else:
-                _LOGGER.warning("Sensor module %s has no async_setup_entry function", module_name)
+                _LOGGER.error("Error setting up sensor module %s: %s", module_name, result)
+            continue
+        if isinstance(result, BaseException):
+            # Never swallow cancellation
+            raise result
 
-        except Exception as exc:
-            _LOGGER.error("Error setting up sensor module %s: %s", module_name, exc)
+        if result:
+            coordinators.append(result)
+            _LOGGER.info("Successfully loaded sensor module: %s", module_name)
+        else:
+            _LOGGER.debug("Sensor module %s returned no coordinator", module_name)
 
     _LOGGER.info("Completed loading of %d sensor modules", len(coordinators))
 
     # Store coordinators in hass data for cleanup
-    if DOMAIN not in hass.data:
-        hass.data[DOMAIN] = {}
-    if "coordinators" not in hass.data[DOMAIN]:
-        hass.data[DOMAIN]["coordinators"] = []
-    hass.data[DOMAIN]["coordinators"].extend(coordinators)
+    hass.data.setdefault(DOMAIN, {}).setdefault(_COORDINATORS, []).extend(coordinators)
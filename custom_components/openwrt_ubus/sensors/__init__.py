@@ -1,5 +1,6 @@
-"""Sensor modules for OpenWrt ubus integration."""
+"""Sensor modules for OpenWrt ubus integration.
 
-from . import ap_sensor, eth_sensor, qmodem_sensor, sta_sensor, system_sensor
+The modules are imported on demand by sensor.py, only when enabled.
+"""
 
 __all__ = ["ap_sensor", "eth_sensor", "qmodem_sensor", "sta_sensor", "system_sensor"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any, Callable
@@ -39,6 +40,9 @@ _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=60)  # AP info doesn't change frequently
 
+# Coordinator data key of the access point information
+_AP_INFO = sys.intern("ap_info")
+
 
 @dataclass
 class SensorValueMapping:
@@ -141,6 +145,13 @@ SENSOR_VALUE_MAPPING = {
     "country": SensorValueMapping(["country"], _get_simple_value, None),
 }
 
+
+def _has_sensor_data(ap_data: dict, key: str) -> bool:
+    """Check if AP data can provide a value for the sensor key."""
+    mapping = SENSOR_VALUE_MAPPING.get(key)
+    return mapping is not None and _has_required_data(ap_data, mapping.data_keys)
+
+
 # Extra attributes mapping: attr_key -> AttributeMapping
 EXTRA_ATTRIBUTES_MAPPING = {
     "phy": AttributeMapping(["phy"], _get_simple_value),
@@ -158,8 +169,40 @@ EXTRA_ATTRIBUTES_MAPPING = {
     "ciphers": AttributeMapping([("encryption", "ciphers")], _get_nested_value),
 }
 
+# Attributes describing the radio hardware, they don't change while the AP exists
+_STATIC_ATTRIBUTES = frozenset({
+    "phy",
+    "hardware_name",
+    "hardware_id",
+    "supported_ht_modes",
+    "supported_hw_modes",
+    "hw_modes_text",
+})
+_STATIC_ATTRIBUTES_MAPPING = {
+    attr_key: mapping for attr_key, mapping in EXTRA_ATTRIBUTES_MAPPING.items() if attr_key in _STATIC_ATTRIBUTES
+}
+_DYNAMIC_ATTRIBUTES_MAPPING = {
+    attr_key: mapping for attr_key, mapping in EXTRA_ATTRIBUTES_MAPPING.items() if attr_key not in _STATIC_ATTRIBUTES
+}
+
+
+def _map_attributes(ap_data: dict, attributes_mapping: dict[str, AttributeMapping], ap_device: str) -> dict[str, Any]:
+    """Build the attributes of an attribute mapping that have a value in AP data."""
+    attributes = {}
+    for attr_key, mapping in attributes_mapping.items():
+        try:
+            # Check if required data exists
+            if _has_required_data(ap_data, mapping.data_keys):
+                value = mapping.convert_function(ap_data, mapping.data_keys)
+                if value is not None:  # Only add attribute if value is not None
+                    attributes[attr_key] = value
+        except (KeyError, TypeError, ValueError) as exc:
+            _LOGGER.debug("Error getting attribute %s for %s: %s", attr_key, ap_device, exc)
+    return attributes
+
+
 # AP sensor descriptions (per access point)
-SENSOR_DESCRIPTIONS = [
+SENSOR_DESCRIPTIONS = (
     SensorEntityDescription(
         key="ssid",
         name="SSID",
@@ -253,7 +296,10 @@ SENSOR_DESCRIPTIONS = [
         icon="mdi:flag",
         entity_category=None,
     ),
-]
+)
+
+# (description, unique_id suffix) pairs, so discovery only concatenates strings
+_UNIQUE_ID_SUFFIXES = tuple((description, f"_{description.key}") for description in SENSOR_DESCRIPTIONS)
 
 
 async def async_setup_entry(
@@ -278,67 +324,53 @@ async def async_setup_entry(
     coordinator = SharedDataUpdateCoordinator(
         hass,
         data_manager,
-        ["ap_info"],  # Data types this coordinator needs
+        [_AP_INFO],  # Data types this coordinator needs
         f"{DOMAIN}_ap_{entry.data[CONF_HOST]}",
         scan_interval,
     )
 
     # Store known devices for dynamic entity creation
     coordinator.known_devices = set()
+    # Hardware attributes per AP device, see ApSensor.extra_state_attributes
+    coordinator.ap_static_attributes = {}
     coordinator.async_add_entities = async_add_entities
 
     # Add update listener for dynamic device creation
     async def _handle_coordinator_update_async():
         """Handle coordinator updates and create new entities for new devices."""
-        if not coordinator.data or "ap_info" not in coordinator.data:
+        if not coordinator.data or _AP_INFO not in coordinator.data:
             return
 
-        ap_info_data = coordinator.data["ap_info"]
-        current_devices = set(ap_info_data.keys())
+        ap_info_data = coordinator.data[_AP_INFO]
+        current_devices = ap_info_data.keys()
 
-        # Handle new devices
+        # Handle new devices, the keys view supports set operations directly
         new_devices = current_devices - coordinator.known_devices
         if new_devices:
             _LOGGER.info("Found %d new AP devices: %s", len(new_devices), new_devices)
 
             # Get entity registry to check for existing entities
             entity_registry = er.async_get(hass)
-
-            new_entities = []
-            for ap_device in new_devices:
-                # Check each sensor type for this device
-                device_sensors_to_add = []
-                for description in SENSOR_DESCRIPTIONS:
-                    unique_id = f"{entry.data[CONF_HOST]}_ap_{ap_device}_{description.key}"
-                    existing_entity_id = entity_registry.async_get_entity_id(
-                        "sensor", DOMAIN, unique_id
-                    )
-
-                    if existing_entity_id:
-                        _LOGGER.debug(
-                            "AP sensor entity %s already exists with entity_id %s, skipping creation",
-                            unique_id, existing_entity_id
-                        )
-                        continue
-
-                    # Check if sensor has required data
-                    ap_data = ap_info_data.get(ap_device, {})
-                    mapping = SENSOR_VALUE_MAPPING.get(description.key)
-                    if mapping and _has_required_data(ap_data, mapping.data_keys):
-                        device_sensors_to_add.append(description)
-
-                # Only add sensors that don't already exist and have data
-                if device_sensors_to_add:
-                    new_entities.extend([
-                        ApSensor(coordinator, description, ap_device)
-                        for description in device_sensors_to_add
-                    ])
-
-                coordinator.known_devices.add(ap_device)
+            existing_unique_ids = {
+                registry_entry.unique_id
+                for registry_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+                if registry_entry.domain == "sensor" and registry_entry.platform == DOMAIN
+            }
+            unique_id_prefix = f"{coordinator.host}_ap_"
+
+            # Only add sensors that don't already exist and have data
+            new_entities = [
+                ApSensor(coordinator, description, ap_device)
+                for ap_device in new_devices
+                for description, unique_id_suffix in _UNIQUE_ID_SUFFIXES
+                if unique_id_prefix + ap_device + unique_id_suffix not in existing_unique_ids
+                and _has_sensor_data(ap_info_data[ap_device], description.key)
+            ]
+            coordinator.known_devices.update(new_devices)
 
             # Add new entities only if there are any
             if new_entities:
-                async_add_entities(new_entities, True)
+                async_add_entities(new_entities)
                 _LOGGER.info("Created %d AP sensor entities for %d new devices",
                              len(new_entities), len(new_devices))
             else:
@@ -353,34 +385,37 @@ async def async_setup_entry(
 
             for ap_device in removed_devices:
                 coordinator.known_devices.discard(ap_device)
+                coordinator.ap_static_attributes.pop(ap_device, None)
 
     # Perform first refresh
     await coordinator.async_config_entry_first_refresh()
 
     # Add initial sensors for any devices already discovered
     initial_entities = []
-    if coordinator.data and coordinator.data.get("ap_info"):
-        ap_info_data = coordinator.data["ap_info"]
-        for ap_device in ap_info_data:
-            coordinator.known_devices.add(ap_device)
-            ap_data = ap_info_data[ap_device]
-
-            # Only add sensors that have the required data
-            for description in SENSOR_DESCRIPTIONS:
-                mapping = SENSOR_VALUE_MAPPING.get(description.key)
-                if mapping and _has_required_data(ap_data, mapping.data_keys):
-                    initial_entities.append(
-                        ApSensor(coordinator, description, ap_device)
-                    )
+    ap_info_data = coordinator.data.get(_AP_INFO) if coordinator.data else None
+    if ap_info_data:
+        coordinator.known_devices.update(ap_info_data)
+        # Only add sensors that have the required data
+        initial_entities = [
+            ApSensor(coordinator, description, ap_device)
+            for ap_device, ap_data in ap_info_data.items()
+            for description in SENSOR_DESCRIPTIONS
+            if _has_sensor_data(ap_data, description.key)
+        ]
 
     # Add initial entities if any
     if initial_entities:
-        async_add_entities(initial_entities, True)
+        async_add_entities(initial_entities)
         _LOGGER.info("Set up %d initial AP sensors", len(initial_entities))
 
     # Create sync wrapper for async coordinator update handler
     def _handle_coordinator_update():
         """Sync wrapper for async coordinator update handler."""
+        # Only schedule the handler when APs appeared or disappeared
+        if not coordinator.data:
+            return
+        if coordinator.data.get(_AP_INFO, {}).keys() == coordinator.known_devices:
+            return
         hass.async_create_task(_handle_coordinator_update_async())
 
     # Register the update listener
@@ -403,21 +438,27 @@ class ApSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self.ap_device = ap_device
-        self._host = coordinator.data_manager.entry.data[CONF_HOST]
+        self._host = coordinator.host
         # Use AP-specific unique ID pattern
         self._attr_unique_id = f"{self._host}_ap_{ap_device}_{description.key}"
         self._attr_has_entity_name = True
+        # Attributes built from the last seen AP data object, see extra_state_attributes
+        self._attrs_source: tuple[dict, bool] | None = None
+        self._attrs_cache: dict[str, Any] = {}
+
+    def _ap_data(self) -> dict | None:
+        """Return the coordinator data of this access point, if present."""
+        data = self.coordinator.data
+        if not data:
+            return None
+        return data.get(_AP_INFO, {}).get(self.ap_device)
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info to link this sensor to a device."""
         # Get device name from AP data if available
-        device_name = f"AP {self.ap_device}"
-        if (self.coordinator.data and "ap_info" in self.coordinator.data
-                and self.ap_device in self.coordinator.data["ap_info"]):
-            ap_data = self.coordinator.data["ap_info"][self.ap_device]
-            if "device_name" in ap_data:
-                device_name = ap_data["device_name"]
+        ap_data = self._ap_data()
+        device_name = ap_data.get("device_name", f"AP {self.ap_device}") if ap_data else f"AP {self.ap_device}"
 
         # Create a device for each AP interface
         return DeviceInfo(
@@ -431,79 +472,67 @@ class ApSensor(CoordinatorEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        if not (
-                self.coordinator.last_update_success
-                and self.coordinator.data is not None
-                and "ap_info" in self.coordinator.data
-                and self.ap_device in self.coordinator.data["ap_info"]
-        ):
+        if not self.coordinator.last_update_success:
             return False
-
-        # Check if sensor has the required data to show a value
-        ap_data = self.coordinator.data["ap_info"][self.ap_device]
-        mapping = SENSOR_VALUE_MAPPING.get(self.entity_description.key)
-        if not mapping:
+        ap_data = self._ap_data()
+        if ap_data is None:
             return False
 
-        # Return False if none of the required keys exist
-        return _has_required_data(ap_data, mapping.data_keys)
+        # Return False if none of the keys required to show a value exist
+        return _has_sensor_data(ap_data, self.entity_description.key)
 
     @property
     def native_value(self) -> str | int | float | None:
         """Return the state of the sensor."""
-        if not self.coordinator.data or "ap_info" not in self.coordinator.data:
-            return None
-
-        ap_info_data = self.coordinator.data["ap_info"]
-        if self.ap_device not in ap_info_data:
+        ap_data = self._ap_data()
+        if ap_data is None:
             return None
 
-        ap_data = ap_info_data[self.ap_device]
         key = self.entity_description.key
 
-        # Get value mapping for this sensor
-        mapping = SENSOR_VALUE_MAPPING.get(key)
-        if not mapping:
-            return None
-
-        # Check if any required keys exist in data
-        if not _has_required_data(ap_data, mapping.data_keys):
-            return mapping.default_value
+        # Every sensor but quality reads its key straight from the AP data
+        if key != "quality":
+            return ap_data.get(key)
 
         try:
-            return mapping.convert_function(ap_data, mapping.data_keys)
-        except (KeyError, TypeError, ValueError) as exc:
+            return _convert_quality_percentage(ap_data, [("quality", "quality_max")])
+        except (TypeError, ValueError, ZeroDivisionError) as exc:
             _LOGGER.debug("Error getting %s for %s: %s", key, self.ap_device, exc)
-            return mapping.default_value
+            return None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        if not self.coordinator.data or "ap_info" not in self.coordinator.data:
+        ap_data = self._ap_data()
+        if ap_data is None:
             return {}
 
-        ap_info_data = self.coordinator.data["ap_info"]
-        if self.ap_device not in ap_info_data:
-            return {}
-
-        ap_data = ap_info_data[self.ap_device]
+        # The data manager hands out the same AP dict until it refetches it,
+        # so identical source objects mean identical attributes.
+        last_update = self.coordinator.last_update_success
+        source = self._attrs_source
+        if source is not None and source[0] is ap_data and source[1] == last_update:
+            return self._attrs_cache
 
         attributes = {
             "ap_device": self.ap_device,
             "router_host": self._host,
-            "last_update": self.coordinator.last_update_success,
+            "last_update": last_update,
         }
 
-        # Add extra attributes using mapping
-        for attr_key, mapping in EXTRA_ATTRIBUTES_MAPPING.items():
-            try:
-                # Check if required data exists
-                if _has_required_data(ap_data, mapping.data_keys):
-                    value = mapping.convert_function(ap_data, mapping.data_keys)
-                    if value is not None:  # Only add attribute if value is not None
-                        attributes[attr_key] = value
-            except (KeyError, TypeError, ValueError) as exc:
-                _LOGGER.debug("Error getting attribute %s for %s: %s", attr_key, self.ap_device, exc)
-                continue
-
+        # Hardware attributes are shared by all sensors of the AP and only
+        # re-read after a failed update
+        static_attributes_cache = self.coordinator.ap_static_attributes
+        if not last_update:
+            static_attributes_cache.pop(self.ap_device, None)
+        static_attributes = static_attributes_cache.get(self.ap_device)
+        if static_attributes is None:
+            static_attributes = _map_attributes(ap_data, _STATIC_ATTRIBUTES_MAPPING, self.ap_device)
+            if last_update:
+                static_attributes_cache[self.ap_device] = static_attributes
+        attributes.update(static_attributes)
+        attributes.update(_map_attributes(ap_data, _DYNAMIC_ATTRIBUTES_MAPPING, self.ap_device))
+
+        self._attrs_source = (ap_data, last_update)
+        self._attrs_cache = attributes
         return attributes
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import logging
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import timedelta
-from typing import Any
+from typing import Any, Callable
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -17,7 +20,7 @@ from homeassistant.const import (
     CONF_HOST,
     UnitOfInformation,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
@@ -35,7 +38,7 @@ _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(minutes=1)  # Network stats change frequently
 
-SENSOR_DESCRIPTIONS = [
+SENSOR_DESCRIPTIONS = (
     SensorEntityDescription(
         key="status",
         name="Status",
@@ -108,7 +111,147 @@ SENSOR_DESCRIPTIONS = [
         state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:alert-circle",
     ),
-]
+)
+
+# Sensor keys read from the device statistics counters, interned because each
+# statistics getter looks its key up in the counters dict on every refresh
+_STAT_KEYS = frozenset(map(sys.intern, (
+    "rx_bytes", "tx_bytes", "rx_packets", "tx_packets",
+    "rx_errors", "tx_errors", "rx_dropped", "tx_dropped",
+)))
+
+# Marks device data keys that are absent
+_MISSING = object()
+
+# Sensor states indexed by the boolean device flag
+_STATUS = ("down", "up")
+_CARRIER = ("disconnected", "connected")
+
+# Sensors describing the physical link, and device types that don't have one
+_LINK_SENSOR_KEYS = frozenset({"speed", "carrier"})
+_LINKLESS_DEVICE_TYPES = frozenset({"pppoe", "tunnel"})
+
+
+def _get_status(device_data: dict) -> str:
+    """Return the link state of a network device."""
+    return _STATUS[bool(device_data.get("up", False))]
+
+
+def _get_speed(device_data: dict) -> Any:
+    """Return the link speed of a network device."""
+    # The duplex suffix is already stripped when the devices are fetched
+    return device_data.get("speed", "unknown")
+
+
+def _get_carrier(device_data: dict) -> str:
+    """Return the carrier state of a network device."""
+    return _CARRIER[bool(device_data.get("carrier", False))]
+
+
+def _get_mtu(device_data: dict) -> int:
+    """Return the MTU of a network device."""
+    return device_data.get("mtu", 0)
+
+
+def _statistics_getter(key: str) -> Callable[[dict], int]:
+    """Return a getter for one counter of the device statistics."""
+    def _get_statistic(device_data: dict) -> int:
+        # Counters are almost always present, avoid building a default dict
+        stats = device_data.get("statistics")
+        try:
+            return stats[key]
+        except (KeyError, TypeError):
+            return 0
+    return _get_statistic
+
+
+def _resolve_device_type(device_name: str, device_data: dict) -> str:
+    """Get the device model name of a network device."""
+    devtype = device_data.get("devtype", "")
+    if devtype == "bridge":
+        return "Bridge"
+    elif devtype == "dsa":
+        return "DSA Port"
+    elif devtype == "ethernet":
+        return "Ethernet"
+    elif devtype == "none":
+        device_type = device_data.get("type", "Network Device")
+        if "pppoe" in device_name.lower():
+            return "PPPoE"
+        elif "tun" in device_name.lower():
+            return "Tunnel"
+        return device_type
+    else:
+        return device_data.get("type", "Network Device")
+
+
+def _device_descriptions(device_type: str, device_data: dict) -> tuple[SensorEntityDescription, ...]:
+    """Return the sensor descriptions that make sense for a network device."""
+    excluded = set()
+    # Point-to-point devices have no physical link to report speed or carrier for
+    if device_type.lower() in _LINKLESS_DEVICE_TYPES:
+        excluded.update(_LINK_SENSOR_KEYS)
+    if "mtu" not in device_data:
+        excluded.add("mtu")
+
+    if not excluded:
+        return SENSOR_DESCRIPTIONS
+    return tuple(description for description in SENSOR_DESCRIPTIONS if description.key not in excluded)
+
+
+def _walk(data: Any, path: tuple[str, ...], default: Any) -> Any:
+    """Return the value at path in nested device data, or default."""
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return default
+        data = data[key]
+    return data
+
+
+def _walk_attributes(device_data: dict, spec: tuple) -> dict[str, Any]:
+    """Build attributes from a (name, path, default) spec in a single pass."""
+    return {name: _walk(device_data, path, default) for name, path, default in spec}
+
+
+# Value getter per sensor key, bound to each entity at creation
+_VALUE_GETTERS: dict[str, Callable[[dict], Any]] = {
+    "status": _get_status,
+    "speed": _get_speed,
+    "carrier": _get_carrier,
+    "mtu": _get_mtu,
+    **{key: _statistics_getter(key) for key in _STAT_KEYS},
+}
+
+
+@dataclass(slots=True, frozen=True)
+class _DevicePlan:
+    """Network interface to create sensors for, resolved during setup."""
+    host: str
+    device_name: str
+    device_info: DeviceInfo
+    descriptions: tuple[SensorEntityDescription, ...]
+
+
+def _plan_devices(network_devices: Mapping[str, dict], host: str) -> list[_DevicePlan]:
+    """Filter the network devices and resolve everything their sensors need in one pass."""
+    plans = []
+    for device_name, device_data in network_devices.items():
+        # Skip loopback and external interfaces (like phy0-ap0, phy1-ap0)
+        if device_name == "lo" or device_data.get("external", False):
+            continue
+
+        # One device per network interface, shared by all of its sensors.
+        # The device type doesn't change, so it is resolved only here.
+        device_type = _resolve_device_type(device_name, device_data)
+        device_info = DeviceInfo(
+            identifiers={(DOMAIN, "_".join((host, device_name)))},
+            name=device_name,
+            manufacturer="OpenWrt",
+            model=device_type,
+            via_device=(DOMAIN, host),  # Link to main router device
+        )
+        plans.append(_DevicePlan(host, device_name, device_info, _device_descriptions(device_type, device_data)))
+    return plans
 
 
 # Network interface sensors will use the shared data manager
@@ -138,7 +281,7 @@ async def async_setup_entry(
         hass,
         data_manager,
         ["network_devices"],  # Data types this coordinator needs
-        f"{DOMAIN}_eth_{entry.data[CONF_HOST]}",
+        "_".join((DOMAIN, "eth", entry.data[CONF_HOST])),
         scan_interval,
     )
 
@@ -152,39 +295,24 @@ async def async_setup_entry(
         network_devices = coordinator.data["network_devices"]
 
         # Validate network devices data structure
-        if not isinstance(network_devices, dict):
+        if not isinstance(network_devices, Mapping):
             _LOGGER.error("Invalid network devices data format: %s", type(network_devices))
             network_devices = {}
 
         _LOGGER.info("Found %d network devices", len(network_devices))
         _LOGGER.debug("Network devices data: %s", network_devices)
 
-        for device_name, device_data in network_devices.items():
-            # Skip invalid entries
-            if not isinstance(device_data, dict):
-                _LOGGER.debug("Skipping invalid device data for %s", device_name)
-                continue
-
-            # Skip loopback and external interfaces (like phy0-ap0, phy1-ap0)
-            if device_name in ["lo"] or device_data.get("external", False):
-                _LOGGER.debug("Skipping device %s (loopback or external)", device_name)
-                continue
-
-            _LOGGER.debug("Creating sensors for network device: %s", device_name)
-
-            # Create sensors for each network interface
-            for description in SENSOR_DESCRIPTIONS:
-                entities.append(
-                    NetworkInterfaceSensor(
-                        coordinator,
-                        description,
-                        device_name,
-                    )
-                )
+        plans = _plan_devices(network_devices, coordinator.host)
+        entities = [
+            NetworkInterfaceSensor(coordinator, description, plan)
+            for plan in plans
+            for description in plan.descriptions
+        ]
     else:
         _LOGGER.warning("No network devices found in coordinator data")
 
-    async_add_entities(entities, True)
+    # Entities already carry the state of the first refresh
+    async_add_entities(entities)
     _LOGGER.info("Created %d network interface sensor entities", len(entities))
 
     # Return the coordinator for the main sensor setup
@@ -194,138 +322,127 @@ async def async_setup_entry(
 class NetworkInterfaceSensor(CoordinatorEntity, SensorEntity):
     """Representation of a OpenWrt network interface sensor."""
 
+    # Own per-entity fields. Home Assistant base classes keep a __dict__,
+    # so the _attr_* attributes stay there.
+    __slots__ = ("device_name", "_host", "_value_getter", "_device_data", "_static_source", "_static_attrs")
+
+    # Device data keys the static attributes are built from
+    _STATIC_SOURCE_KEYS = (
+        "type", "macaddr", "devtype", "flow-control", "bridge-attributes", "bridge-members",
+        "link-advertising", "link-partner-advertising", "link-supported", "conduit",
+    )
+
+    # Attribute specs: (attribute name, path in the device data, default).
+    # Defaults are immutable, they are handed out to every entity as is.
+    _STATIC_ATTR_SPEC = (
+        ("device_type", ("type",), "unknown"),
+        ("mac_address", ("macaddr",), "unknown"),
+        ("devtype", ("devtype",), "unknown"),
+    )
+    _DYNAMIC_ATTR_SPEC = (
+        ("present", ("present",), False),
+        ("external", ("external",), False),
+        ("txqueuelen", ("txqueuelen",), 0),
+        ("ipv6", ("ipv6",), False),
+        ("multicast", ("multicast",), False),
+        ("autoneg", ("autoneg",), False),
+    )
+    _FLOW_CONTROL_ATTR_SPEC = (
+        ("flow_control_autoneg", ("flow-control", "autoneg"), False),
+        ("flow_control_supported", ("flow-control", "supported"), ()),
+        ("flow_control_advertising", ("flow-control", "link-advertising"), ()),
+        ("flow_control_partner_advertising", ("flow-control", "link-partner-advertising"), ()),
+        ("flow_control_negotiated", ("flow-control", "negotiated"), ()),
+    )
+    _BRIDGE_ATTR_SPEC = (
+        ("bridge_stp", ("bridge-attributes", "stp"), False),
+        ("bridge_priority", ("bridge-attributes", "priority"), 0),
+        ("bridge_ageing_time", ("bridge-attributes", "ageing_time"), 0),
+        ("bridge_hello_time", ("bridge-attributes", "hello_time"), 1),
+        ("bridge_max_age", ("bridge-attributes", "max_age"), 10),
+        ("bridge_forward_delay", ("bridge-attributes", "forward_delay"), 8),
+        ("bridge_igmp_snooping", ("bridge-attributes", "igmp_snooping"), False),
+        ("bridge_members", ("bridge-members",), ()),
+    )
+    _LINK_ATTR_SPEC = (
+        ("link_advertising", ("link-advertising",), ()),
+        ("link_partner_advertising", ("link-partner-advertising",), ()),
+        ("link_supported", ("link-supported",), ()),
+    )
+
     def __init__(
             self,
             coordinator: SharedDataUpdateCoordinator,
             description: SensorEntityDescription,
-            device_name: str,
+            plan: _DevicePlan,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self.device_name = device_name
-        self._host = coordinator.data_manager.entry.data[CONF_HOST]
+        self.device_name = plan.device_name
+        self._host = plan.host
+        self._value_getter = _VALUE_GETTERS[description.key]
 
         # Set unique ID
-        self._attr_unique_id = f"{self._host}_{device_name}_{description.key}"
+        self._attr_unique_id = "_".join((plan.host, plan.device_name, description.key))
         self._attr_has_entity_name = True
 
-        # Set device info - create a device for each network interface
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{self._host}_{device_name}")},
-            name=f"{device_name}",
-            manufacturer="OpenWrt",
-            model=self._get_device_type(),
-            via_device=(DOMAIN, self._host),  # Link to main router device
-        )
-
-    def _get_device_type(self) -> str:
-        """Get device type from coordinator data."""
-        if not self.coordinator.data or "network_devices" not in self.coordinator.data:
-            return "Network Device"
-
-        network_devices = self.coordinator.data["network_devices"]
-        device_data = network_devices.get(self.device_name, {})
-
-        devtype = device_data.get("devtype", "")
-        if devtype == "bridge":
-            return "Bridge"
-        elif devtype == "dsa":
-            return "DSA Port"
-        elif devtype == "ethernet":
-            return "Ethernet"
-        elif devtype == "none":
-            device_type = device_data.get("type", "Network Device")
-            if "pppoe" in self.device_name.lower():
-                return "PPPoE"
-            elif "tun" in self.device_name.lower():
-                return "Tunnel"
-            return device_type
-        else:
-            return device_data.get("type", "Network Device")
-
-    @property
-    def native_value(self) -> Any:
-        """Return the state of the sensor."""
-        if not self.coordinator.data or "network_devices" not in self.coordinator.data:
-            return None
-
-        network_devices = self.coordinator.data["network_devices"]
-        device_data = network_devices.get(self.device_name, {})
-
-        if self.entity_description.key == "status":
-            return "up" if device_data.get("up", False) else "down"
-        elif self.entity_description.key == "speed":
-            speed = device_data.get("speed", "unknown")
-            if isinstance(speed, str) and speed.endswith("F"):
-                return speed[:-1]  # Remove 'F' suffix (e.g. "1000F" -> "1000")
-            return speed
-        elif self.entity_description.key == "carrier":
-            return "connected" if device_data.get("carrier", False) else "disconnected"
-        elif self.entity_description.key == "mtu":
-            return device_data.get("mtu", 0)
-        elif self.entity_description.key in [
-            "rx_bytes", "tx_bytes", "rx_packets", "tx_packets",
-            "rx_errors", "tx_errors", "rx_dropped", "tx_dropped"
-        ]:
-            stats = device_data.get("statistics", {})
-            return stats.get(self.entity_description.key, 0)
-
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        if not self.coordinator.data or "network_devices" not in self.coordinator.data:
-            return {}
-
-        network_devices = self.coordinator.data["network_devices"]
-        device_data = network_devices.get(self.device_name, {})
-
-        attrs = {
-            "device_type": device_data.get("type", "unknown"),
-            "mac_address": device_data.get("macaddr", "unknown"),
-            "present": device_data.get("present", False),
-            "external": device_data.get("external", False),
-            "devtype": device_data.get("devtype", "unknown"),
-            "txqueuelen": device_data.get("txqueuelen", 0),
-            "ipv6": device_data.get("ipv6", False),
-            "multicast": device_data.get("multicast", False),
-            "autoneg": device_data.get("autoneg", False),
-        }
+        # Device info is shared by all sensors of the network interface
+        self._attr_device_info = plan.device_info
+
+        self._static_source: tuple | None = None
+        self._static_attrs: dict[str, Any] = {}
+
+        # State is pushed on coordinator updates, start from the current data
+        self._update_from_coordinator()
+
+    def _update_from_coordinator(self) -> None:
+        """Compute state and attributes from the coordinator data."""
+        data = self.coordinator.data
+        if not data or "network_devices" not in data:
+            self._device_data = None
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
+            return
+
+        # Validated once per refresh, value and attributes read it directly
+        self._device_data = device_data = data["network_devices"].get(self.device_name, {})
+        self._attr_native_value = self._value_getter(device_data)
+        self._attr_extra_state_attributes = self._build_attributes(device_data)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update state and attributes once per coordinator refresh."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    def _build_attributes(self, device_data: dict) -> dict[str, Any]:
+        """Build the state attributes of a network device."""
+        # Addressing, bridge, flow control and link attributes rarely change,
+        # only rebuild them when their source data does
+        static_source = tuple(device_data.get(key, _MISSING) for key in self._STATIC_SOURCE_KEYS)
+        if static_source != self._static_source:
+            self._static_source = static_source
+            self._static_attrs = self._build_static_attributes(device_data)
+
+        return {**self._static_attrs, **_walk_attributes(device_data, self._DYNAMIC_ATTR_SPEC)}
+
+    @classmethod
+    def _build_static_attributes(cls, device_data: dict) -> dict[str, Any]:
+        """Build the state attributes that only change on reconfiguration."""
+        attrs = _walk_attributes(device_data, cls._STATIC_ATTR_SPEC)
 
         # Add flow control info if available
         if "flow-control" in device_data:
-            flow_control = device_data["flow-control"]
-            attrs.update({
-                "flow_control_autoneg": flow_control.get("autoneg", False),
-                "flow_control_supported": flow_control.get("supported", []),
-                "flow_control_advertising": flow_control.get("link-advertising", []),
-                "flow_control_partner_advertising": flow_control.get("link-partner-advertising", []),
-                "flow_control_negotiated": flow_control.get("negotiated", []),
-            })
+            attrs.update(_walk_attributes(device_data, cls._FLOW_CONTROL_ATTR_SPEC))
 
         # Add bridge info if it's a bridge
         if device_data.get("type") == "bridge":
-            bridge_attrs = device_data.get("bridge-attributes", {})
-            attrs.update({
-                "bridge_stp": bridge_attrs.get("stp", False),
-                "bridge_priority": bridge_attrs.get("priority", 0),
-                "bridge_ageing_time": bridge_attrs.get("ageing_time", 0),
-                "bridge_hello_time": bridge_attrs.get("hello_time", 1),
-                "bridge_max_age": bridge_attrs.get("max_age", 10),
-                "bridge_forward_delay": bridge_attrs.get("forward_delay", 8),
-                "bridge_igmp_snooping": bridge_attrs.get("igmp_snooping", False),
-                "bridge_members": device_data.get("bridge-members", []),
-            })
+            attrs.update(_walk_attributes(device_data, cls._BRIDGE_ATTR_SPEC))
 
         # Add link info if available
         if "link-advertising" in device_data:
-            attrs.update({
-                "link_advertising": device_data.get("link-advertising", []),
-                "link_partner_advertising": device_data.get("link-partner-advertising", []),
-                "link_supported": device_data.get("link-supported", []),
-            })
+            attrs.update(_walk_attributes(device_data, cls._LINK_ATTR_SPEC))
 
         # Add conduit for DSA ports
         if "conduit" in device_data:
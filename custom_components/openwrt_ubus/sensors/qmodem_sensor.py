@@ -22,7 +22,7 @@ from homeassistant.const import (
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
     SIGNAL_STRENGTH_DECIBELS,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
@@ -40,7 +40,51 @@ _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(minutes=2)  # QModem info changes more frequently
 
-SENSOR_DESCRIPTIONS = [
+# Leading integer of a reported value (e.g. "-95 dBm", "71°C", "3980 mV")
+_SIGNED_INT_RE = re.compile(r"(-?\d+)")
+_INT_RE = re.compile(r"(\d+)")
+
+# Signal sensor key -> (cell context, signal name, value pattern)
+_SIGNAL_MAP = {
+    "qmodem_lte_rsrp": ("LTE", "RSRP", _SIGNED_INT_RE),
+    "qmodem_lte_rsrq": ("LTE", "RSRQ", _SIGNED_INT_RE),
+    "qmodem_lte_rssi": ("LTE", "RSSI", _SIGNED_INT_RE),
+    "qmodem_lte_sinr": ("LTE", "SINR", _INT_RE),
+    "qmodem_nr5g_rsrp": ("NR5G", "RSRP", _SIGNED_INT_RE),
+    "qmodem_nr5g_rsrq": ("NR5G", "RSRQ", _SIGNED_INT_RE),
+    "qmodem_nr5g_sinr": ("NR5G", "SINR", _INT_RE),
+}
+
+# (cell context, signal name) pairs reported as progress bars
+_CONTEXT_SIGNALS = frozenset((context, name) for context, name, _ in _SIGNAL_MAP.values())
+
+# Base information item key -> sensor key
+_BASE_KEY_MAP = {
+    "manufacturer": "qmodem_manufacturer",
+    "revision": "qmodem_revision",
+    "at_port": "qmodem_at_port",
+    "temperature": "qmodem_temperature",
+    "voltage": "qmodem_voltage",
+    "connect_status": "qmodem_connect_status",
+}
+
+# Base information sensors reported with a unit (e.g. "71°C", "3980 mV")
+_BASE_NUMERIC_KEYS = frozenset({"qmodem_temperature", "qmodem_voltage"})
+
+# SIM information item key -> sensor key
+_SIM_KEY_MAP = {
+    "SIM Status": "qmodem_sim_status",
+    "ISP": "qmodem_isp",
+    "SIM Slot": "qmodem_sim_slot",
+    "IMEI": "qmodem_imei",
+    "IMSI": "qmodem_imsi",
+    "ICCID": "qmodem_iccid",
+}
+
+# Coordinator data key of the sensor values extracted from the QModem report
+_QMODEM_VALUES = "qmodem_values"
+
+SENSOR_DESCRIPTIONS = (
     # QModem Base Information sensors
     SensorEntityDescription(
         key="qmodem_manufacturer",
@@ -185,7 +229,117 @@ SENSOR_DESCRIPTIONS = [
         icon="mdi:signal-5g",
         entity_category=None,
     ),
-]
+)
+
+# Unique ID suffix per sensor key, the 'qmodem_' prefix is already part of the unique ID
+_UNIQUE_ID_SUFFIXES = {
+    description.key: description.key.removeprefix("qmodem_") for description in SENSOR_DESCRIPTIONS
+}
+
+
+def _process_base_info(item_key: str, value: str, values: dict[str, Any]) -> None:
+    """Store the sensor value of a base information item."""
+    target_key = _BASE_KEY_MAP.get(item_key)
+    # The first item reporting a value wins
+    if target_key is None or target_key in values:
+        return
+
+    if target_key in _BASE_NUMERIC_KEYS:
+        # Extract numeric value from temperature or voltage string (e.g., "71°C", "3980 mV")
+        numeric_match = _INT_RE.search(str(value))
+        result = int(numeric_match.group(1)) if numeric_match else None
+    else:
+        result = str(value) if value else None
+
+    if result is not None:
+        values[target_key] = result
+
+
+def _process_sim_info(item_key: str, value: str, values: dict[str, Any]) -> None:
+    """Store the sensor value of a SIM information item."""
+    target_key = _SIM_KEY_MAP.get(item_key)
+    # The first item reporting a value wins
+    if target_key is None or target_key in values:
+        return
+
+    # Clean up value - remove newlines and extra spaces
+    clean_value = str(value).replace('\n', ' ').strip() if value else None
+    if clean_value:
+        values[target_key] = clean_value
+
+
+# Item handler per modem info class
+_CLASS_DISPATCH = {
+    "Base Information": _process_base_info,
+    "SIM Information": _process_sim_info,
+}
+
+
+def _process_qmodem_info(qmodem_info: dict) -> dict[str, Any]:
+    """Extract the values of all QModem sensors from a report in a single pass."""
+    info_list = qmodem_info.get("info", [])
+    # Nothing to walk when no modem reports any item
+    if not any(info_item.get("modem_info") for info_item in info_list):
+        return {}
+
+    values: dict[str, Any] = {}
+    signals: dict[tuple[str | None, str], Any] = {}
+    get_handler = _CLASS_DISPATCH.get
+
+    for info_item in info_list:
+        modem_info_list = info_item.get("modem_info", [])
+        if not modem_info_list:
+            continue
+
+        # Track context for LTE vs 5G NR signals, the last modem reports them
+        current_context = None
+        signals = {}
+
+        for item in modem_info_list:
+            item_get = item.get
+            class_origin = item_get("class_origin", "")
+            item_key = item_get("key", "")
+            value = item_get("value", "")
+            item_type = item_get("type", "")
+
+            # Update context based on special keys
+            if item_key == "LTE":
+                current_context = "LTE"
+            elif item_key.startswith("NR"):  # NR5G-NSA or any NR variant for 5G
+                current_context = "NR5G"
+
+            handler = get_handler(class_origin)
+            if handler is not None:
+                handler(item_key, value, values)
+            elif item_type == "progress_bar" and class_origin == "Cell Information":
+                # Store signal values with context
+                signal = (current_context, item_key)
+                if signal in _CONTEXT_SIGNALS:
+                    signals[signal] = value
+
+    for key, (context, name, pattern) in _SIGNAL_MAP.items():
+        if (context, name) in signals:
+            numeric_match = pattern.search(str(signals[context, name]))
+            values[key] = int(numeric_match.group(1)) if numeric_match else None
+
+    return values
+
+
+class QModemCoordinator(SharedDataUpdateCoordinator):
+    """Coordinator that parses the QModem report once per refresh."""
+
+    async def _async_update_data(self):
+        """Fetch QModem info and extract the values of all sensors from it."""
+        data = await super()._async_update_data()
+        qmodem_info = data.get("qmodem_info") if data else None
+        if qmodem_info is not None:
+            try:
+                data[_QMODEM_VALUES] = _process_qmodem_info(qmodem_info)
+            except Exception as exc:
+                _LOGGER.error("Error extracting qmodem values: %s", exc)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("QModem data causing error: %s", qmodem_info)
+        return data
 
 
 async def async_setup_entry(
@@ -213,7 +367,7 @@ async def async_setup_entry(
     scan_interval = timedelta(seconds=timeout)
     
     # Create coordinator using shared data manager
-    coordinator = SharedDataUpdateCoordinator(
+    coordinator = QModemCoordinator(
         hass,
         data_manager,
         ["qmodem_info"],  # Data types this coordinator needs
@@ -238,53 +392,65 @@ async def async_setup_entry(
 class QModemSensor(CoordinatorEntity, SensorEntity):
     """Representation of a QModem sensor."""
 
+    # Own per-entity fields. Home Assistant base classes keep a __dict__,
+    # so the _attr_* attributes stay there.
+    __slots__ = ("_host", "_base_attributes")
+
     def __init__(
         self,
-        coordinator: SharedDataUpdateCoordinator,
+        coordinator: QModemCoordinator,
         description: SensorEntityDescription,
     ) -> None:
         """Initialize the QModem sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._host = coordinator.data_manager.entry.data[CONF_HOST]
+        self._host = coordinator.host
         self.hass = coordinator.hass  # Add reference to hass
-        # Remove the 'qmodem_' prefix from description.key to avoid duplication
-        key_without_prefix = description.key.replace("qmodem_", "", 1)
-        self._attr_unique_id = f"{self._host}_qmodem_{key_without_prefix}"
+        self._attr_unique_id = f"{self._host}_qmodem_{_UNIQUE_ID_SUFFIXES[description.key]}"
         self._attr_has_entity_name = True
+        self._base_attributes = {"router_host": self._host, "device_type": "qmodem"}
+        self._attr_device_info = self._build_device_info(coordinator)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for the QModem device."""
-        # Try to get manufacturer from QModem data
+        # State is pushed on coordinator updates, start from the current data
+        self._update_from_coordinator()
+
+    def _update_from_coordinator(self) -> None:
+        """Compute state and attributes from the coordinator data."""
+        self._attr_native_value = self._compute_value()
+        self._attr_extra_state_attributes = self._build_attributes()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update state and attributes once per coordinator refresh."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    @staticmethod
+    def _build_device_info(coordinator: QModemCoordinator) -> DeviceInfo:
+        """Build the device info of the QModem device."""
+        # Home Assistant reads the device info when the entity is added,
+        # so the modem details of the first refresh are the ones registered
         manufacturer = "Unknown"
         model = "QModem Device"
-        
-        if self.coordinator.data and self.coordinator.data.get("qmodem_info"):
-            qmodem_info = self.coordinator.data["qmodem_info"]
-            try:
-                manufacturer_value = self._extract_qmodem_value(qmodem_info, "qmodem_manufacturer")
-                if manufacturer_value:
-                    manufacturer = manufacturer_value
-                
-                revision_value = self._extract_qmodem_value(qmodem_info, "qmodem_revision")
-                if revision_value:
-                    model = f"QModem {revision_value}"
-            except Exception:
-                pass  # Use default values if extraction fails
-        
+
+        values = coordinator.data.get(_QMODEM_VALUES) if coordinator.data else None
+        if values:
+            manufacturer = values.get("qmodem_manufacturer") or manufacturer
+            revision_value = values.get("qmodem_revision")
+            if revision_value:
+                model = f"QModem {revision_value}"
+
         # Create a separate device for QModem
         return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._host}_qmodem")},
-            name=f"QModem ({self._host})",
+            identifiers={(DOMAIN, f"{coordinator.host}_qmodem")},
+            name=f"QModem ({coordinator.host})",
             manufacturer=manufacturer,
             model=model,
-            configuration_url=f"http://{self._host}",
-            via_device=(DOMAIN, self._host),
+            configuration_url=f"http://{coordinator.host}",
+            via_device=(DOMAIN, coordinator.host),
         )
 
-    @property
-    def native_value(self) -> Any:
+    def _compute_value(self) -> Any:
         """Return the value reported by the sensor."""
         if not self.coordinator.data:
             _LOGGER.debug("No coordinator data available for %s", self.entity_description.key)
@@ -295,149 +461,26 @@ class QModemSensor(CoordinatorEntity, SensorEntity):
             _LOGGER.debug("No qmodem_info in coordinator data for %s", self.entity_description.key)
             return None
 
-        # Parse the qmodem data and extract the requested value
-        try:
-            value = self._extract_qmodem_value(qmodem_info, self.entity_description.key)
-            return value if value is not None else "no_data"
-        except Exception as exc:
-            _LOGGER.error("Error extracting qmodem value for %s: %s", self.entity_description.key, exc)
-            _LOGGER.debug("QModem data causing error: %s", qmodem_info)
+        # Values are extracted by the coordinator, missing when the report couldn't be parsed
+        values = self.coordinator.data.get(_QMODEM_VALUES)
+        if values is None:
             return "error"
 
-    def _extract_qmodem_value(self, qmodem_info: dict, key: str) -> Any:
-        """Extract specific value from QModem info."""
-        # Follow the same pattern as backup_sensor.py QModemCoordinator
-        info_list = qmodem_info.get("info", [])
-        if not info_list:
-            _LOGGER.debug("No info list found in qmodem_info for key %s", key)
-            return None
-            
-        # Process each info item
-        for info_item in info_list:
-            modem_info_list = info_item.get("modem_info", [])
-            if not modem_info_list:
-                continue
-                
-            # Track context for LTE vs 5G NR signals
-            current_context = None
-            lte_signals = {}
-            nr5g_signals = {}
-                
-            # Process each modem info item to find our value
-            for item in modem_info_list:
-                class_origin = item.get("class_origin", "")
-                item_key = item.get("key", "")
-                value = item.get("value", "")
-                item_type = item.get("type", "")
-                
-                # Update context based on special keys
-                if item_key == "LTE":
-                    current_context = "LTE"
-                elif item_key.startswith("NR"):  # NR5G-NSA or any NR variant for 5G
-                    current_context = "NR5G"
-                
-                # Process based on sensor key and class origin
-                if class_origin == "Base Information":
-                    result = self._process_base_info_item(item_key, value, key)
-                    if result is not None:
-                        return result
-                elif class_origin == "SIM Information":
-                    result = self._process_sim_info_item(item_key, value, key)
-                    if result is not None:
-                        return result
-                elif item_type == "progress_bar" and class_origin == "Cell Information":
-                    # Store signal values with context
-                    if current_context == "LTE" and item_key in ["RSRP", "RSRQ", "RSSI", "SINR"]:
-                        lte_signals[item_key] = value
-                    elif current_context == "NR5G" and item_key in ["RSRP", "RSRQ", "SINR"]:
-                        nr5g_signals[item_key] = value
-        
-        # Check if we found the requested signal value
-        if key == "qmodem_lte_rsrp" and "RSRP" in lte_signals:
-            numeric_match = re.search(r'(-?\d+)', str(lte_signals["RSRP"]))
-            return int(numeric_match.group(1)) if numeric_match else None
-        elif key == "qmodem_lte_rsrq" and "RSRQ" in lte_signals:
-            numeric_match = re.search(r'(-?\d+)', str(lte_signals["RSRQ"]))
-            return int(numeric_match.group(1)) if numeric_match else None
-        elif key == "qmodem_lte_rssi" and "RSSI" in lte_signals:
-            numeric_match = re.search(r'(-?\d+)', str(lte_signals["RSSI"]))
-            return int(numeric_match.group(1)) if numeric_match else None
-        elif key == "qmodem_lte_sinr" and "SINR" in lte_signals:
-            numeric_match = re.search(r'(\d+)', str(lte_signals["SINR"]))
-            return int(numeric_match.group(1)) if numeric_match else None
-        elif key == "qmodem_nr5g_rsrp" and "RSRP" in nr5g_signals:
-            numeric_match = re.search(r'(-?\d+)', str(nr5g_signals["RSRP"]))
-            return int(numeric_match.group(1)) if numeric_match else None
-        elif key == "qmodem_nr5g_rsrq" and "RSRQ" in nr5g_signals:
-            numeric_match = re.search(r'(-?\d+)', str(nr5g_signals["RSRQ"]))
-            return int(numeric_match.group(1)) if numeric_match else None
-        elif key == "qmodem_nr5g_sinr" and "SINR" in nr5g_signals:
-            numeric_match = re.search(r'(\d+)', str(nr5g_signals["SINR"]))
-            return int(numeric_match.group(1)) if numeric_match else None
-        
-        _LOGGER.debug("No matching value found for key %s in qmodem data", key)
-        return None
-
-    def _process_base_info_item(self, item_key: str, value: str, target_key: str) -> Any:
-        """Process base information item and return value if it matches target key."""
-        key_mapping = {
-            "manufacturer": "qmodem_manufacturer",
-            "revision": "qmodem_revision",
-            "at_port": "qmodem_at_port",
-            "temperature": "qmodem_temperature",
-            "voltage": "qmodem_voltage",
-            "connect_status": "qmodem_connect_status",
-        }
-        
-        if item_key in key_mapping and key_mapping[item_key] == target_key:
-            if target_key == "qmodem_temperature":
-                # Extract numeric value from temperature string (e.g., "71°C")
-                numeric_match = re.search(r'(\d+)', str(value))
-                return int(numeric_match.group(1)) if numeric_match else None
-            elif target_key == "qmodem_voltage":
-                # Extract numeric value from voltage string (e.g., "3980 mV")
-                numeric_match = re.search(r'(\d+)', str(value))
-                return int(numeric_match.group(1)) if numeric_match else None
-            else:
-                return str(value) if value else None
-        return None
-
-    def _process_sim_info_item(self, item_key: str, value: str, target_key: str) -> Any:
-        """Process SIM information item and return value if it matches target key."""
-        key_mapping = {
-            "SIM Status": "qmodem_sim_status",
-            "ISP": "qmodem_isp",
-            "SIM Slot": "qmodem_sim_slot",
-            "IMEI": "qmodem_imei",
-            "IMSI": "qmodem_imsi", 
-            "ICCID": "qmodem_iccid",
-        }
-        
-        if item_key in key_mapping and key_mapping[item_key] == target_key:
-            # Clean up value - remove newlines and extra spaces
-            clean_value = str(value).replace('\n', ' ').strip() if value else None
-            return clean_value if clean_value else None
-        return None
+        value = values.get(self.entity_description.key)
+        return value if value is not None else "no_data"
 
     @property
     def available(self) -> bool:
         """Return True if coordinator is available and qmodem/modem_ctrl is accessible."""
-        # Always show as available if coordinator is updating successfully
-        # This allows the entity to display "Unknown" state instead of being disabled
-        if not self.coordinator.last_update_success:
-            # Only mark as unavailable if there's a clear connection failure
-            return True  # Changed: be more permissive about availability
-        
-        # Even if no qmodem data, keep entity available to show proper state
+        # Keep the entity available even on failed updates or without qmodem data,
+        # so it displays its "Unknown"/"no_data" state instead of being disabled
         return True
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return additional state attributes."""        
+    def _build_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
         attributes = {
-            "router_host": self._host,
+            **self._base_attributes,
             "last_update": self.coordinator.last_update_success,
-            "device_type": "qmodem",
         }
 
         # Add status information based on data availability
@@ -445,7 +488,9 @@ class QModemSensor(CoordinatorEntity, SensorEntity):
             qmodem_info = self.coordinator.data.get("qmodem_info")
             if qmodem_info is not None:
                 attributes["data_status"] = "available"
-                attributes["raw_data"] = str(qmodem_info)
+                # The whole report is large and identical for every sensor, only expose it when debugging
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    attributes["raw_data"] = str(qmodem_info)
             else:
                 attributes["data_status"] = "no_data"
         else:
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import logging
+import sys
 import time
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any, Callable
 
 from homeassistant.components.sensor import (
@@ -21,7 +22,7 @@ from homeassistant.const import (
     UnitOfInformation,
     UnitOfDataRate
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -42,13 +43,22 @@ _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=30)  # Device stats change more frequently
 
+# Unit conversion factors
+_KBPS_TO_MBPS = 0.001
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+# Unchanged statistics double the poll interval, at most this many times
+_MAX_IDLE_BACKOFF = 3
+
 
 @dataclass
 class SensorValueMapping:
     """Data class for sensor value mapping configuration."""
     data_keys: list[str | tuple]
-    convert_function: Callable
+    convert_function: Callable | None
     default_value: Any = None
+    # Computed by the coordinator from consecutive samples instead of converted
+    needs_history: bool = False
 
 
 @dataclass
@@ -66,7 +76,7 @@ def _get_simple_value(device_data: dict, keys: list[str], sensor_instance=None)
     return None
 
 
-def _get_nested_value(ap_data: dict, keys: list[tuple]) -> Any:
+def _get_nested_value(ap_data: dict, keys: list[tuple], sensor_instance=None) -> Any:
     """Get value from nested dictionary using tuple keys for nested access."""
 
     def get_value(data: dict, key_path: tuple) -> Any:
@@ -100,7 +110,7 @@ def _convert_rate_to_mbps(device_data: dict, keys: list[str], sensor_instance=No
             child_key = nested_key[1]
             rate_kbps = device_data.get(parent_key, {}).get(child_key)
             if rate_kbps is not None:
-                return round(rate_kbps / 1000, 2)
+                return round(rate_kbps * _KBPS_TO_MBPS, 2)
     return None
 
 
@@ -112,41 +122,65 @@ def _convert_bytes_to_mb(device_data: dict, keys: list[str], sensor_instance=Non
             child_key = nested_key[1]
             bytes_value = device_data.get(parent_key, {}).get(child_key)
             if bytes_value is not None:
-                return round(bytes_value / (1024 * 1024), 2)
+                return round(bytes_value * _BYTES_TO_MB, 2)
     return None
 
 
-def _calculate_speed(device_data: dict, keys: list[str], sensor_instance=None) -> float | None:
-    """Calculate speed based on bytes."""
-    data_bytes = _get_nested_value(device_data, keys)
-    rx = False
-    # if key contains rx/tx
-    if data_bytes is None:
-        return None
-    if keys[0][0].startswith("rx"):
-        rx = True
-    # rx/tx
-    if sensor_instance:
-        current_time = time.time()
-        if sensor_instance._previous_update_time is None:
-            sensor_instance._previous_update_time = current_time
-            if rx:
-                sensor_instance._previous_rx_bytes = data_bytes
-            else:
-                sensor_instance._previous_tx_bytes = data_bytes
-            return None
-        elapsed_time = current_time - sensor_instance._previous_update_time
-        sensor_instance._previous_update_time = current_time
-        if rx:
-            speed = (data_bytes - sensor_instance._previous_rx_bytes) / elapsed_time
-            sensor_instance._previous_rx_bytes = data_bytes
-        else:
-            speed = (data_bytes - sensor_instance._previous_tx_bytes) / elapsed_time
-            sensor_instance._previous_tx_bytes = data_bytes
-        # Convert to Kbps
-        if speed < 0:
-            speed = 0
-        return speed * 8 / 1024
+def _compute_speed_kbps(
+        previous_bytes: int | None,
+        current_bytes: int,
+        previous_time: float | None,
+        current_time: float,
+) -> float:
+    """Compute the speed in Kbps between two byte counter samples.
+
+    Without a previous sample there is no traffic to report yet, so 0.
+    """
+    if previous_bytes is None or previous_time is None or current_time <= previous_time:
+        return 0
+    # The counter restarts from zero when the device reconnects
+    speed = max(current_bytes - previous_bytes, 0) / (current_time - previous_time)
+    # Bytes/s to kilobits/s, with the SI kilo of UnitOfDataRate.KILOBITS_PER_SECOND
+    return round(speed * 8 / 1000, 3)
+
+
+@dataclass(slots=True)
+class SpeedTracker:
+    """Previous byte counter sample of a device, shared by its speed sensors."""
+
+    rx_bytes: int | None = None
+    tx_bytes: int | None = None
+    update_time: float | None = None
+
+    def update(self, device_data: dict, current_time: float) -> tuple[float, float]:
+        """Store a new sample and return the rx and tx speeds in Kbps since the previous one."""
+        rx_bytes = _get_nested_value(device_data, [("rx", "bytes")])
+        tx_bytes = _get_nested_value(device_data, [("tx", "bytes")])
+
+        # Like the mapping default, a missing counter reads as no traffic
+        rx_speed = tx_speed = 0
+        if rx_bytes is not None:
+            rx_speed = _compute_speed_kbps(self.rx_bytes, rx_bytes, self.update_time, current_time)
+        if tx_bytes is not None:
+            tx_speed = _compute_speed_kbps(self.tx_bytes, tx_bytes, self.update_time, current_time)
+
+        self.rx_bytes = rx_bytes
+        self.tx_bytes = tx_bytes
+        self.update_time = current_time
+        return rx_speed, tx_speed
+
+
+@dataclass(slots=True)
+class _DeviceAttributes:
+    """State attributes of a device, shared by all its sensors."""
+
+    # What the attributes were built from
+    device_data: dict
+    router_host: str
+    last_update: bool
+    # Attributes of every sensor, and those of the signal sensor with the extra link details
+    base: dict[str, Any]
+    signal: dict[str, Any] | None = None
 
 
 def _get_online_status(device_data: dict, keys: list[str], sensor_instance=None) -> bool:
@@ -186,35 +220,29 @@ SENSOR_VALUE_MAPPING = {
     "tx_packets": SensorValueMapping([("tx", "packets")], _get_nested_value, 0),
     "rx_bytes": SensorValueMapping([("rx", "bytes")], _convert_bytes_to_mb, 0),
     "tx_bytes": SensorValueMapping([("tx", "bytes")], _convert_bytes_to_mb, 0),
-    "rx_speed": SensorValueMapping([("rx", "bytes")], _calculate_speed, 0),
-    "tx_speed": SensorValueMapping([("tx", "bytes")], _calculate_speed, 0),
+    "rx_speed": SensorValueMapping([("rx", "bytes")], None, 0, needs_history=True),
+    "tx_speed": SensorValueMapping([("tx", "bytes")], None, 0, needs_history=True),
     "online": SensorValueMapping([], _get_online_status, False),
 }
 
+# Link attributes reported for both directions, and those reported for tx only
+_LINK_ATTRIBUTE_KEYS = ("ht", "vht", "he", "mhz", "mcs", "40mhz", "short_gi")
+_TX_ATTRIBUTE_KEYS = ("failed", "retries")
+
 # Extra attributes mapping: attr_key -> AttributeMapping
 EXTRA_ATTRIBUTES_MAPPING = {
     "authorized": AttributeMapping(["authorized"], _get_simple_value),
     "authenticated": AttributeMapping(["authenticated"], _get_simple_value),
     "inactive_time": AttributeMapping(["inactive"], _get_simple_value),
-    "rx_ht": AttributeMapping([("rx", "ht")], _get_nested_value),
-    "rx_vht": AttributeMapping([("rx", "vht")], _get_nested_value),
-    "rx_he": AttributeMapping([("rx", "he")], _get_nested_value),
-    "rx_mhz": AttributeMapping([("rx", "mhz")], _get_nested_value),
-    "rx_mcs": AttributeMapping([("rx", "mcs")], _get_nested_value),
-    "rx_40mhz": AttributeMapping([("rx", "40mhz")], _get_nested_value),
-    "rx_short_gi": AttributeMapping([("rx", "short_gi")], _get_nested_value),
-    "tx_ht": AttributeMapping([("tx", "ht")], _get_nested_value),
-    "tx_vht": AttributeMapping([("tx", "vht")], _get_nested_value),
-    "tx_he": AttributeMapping([("tx", "he")], _get_nested_value),
-    "tx_mhz": AttributeMapping([("tx", "mhz")], _get_nested_value),
-    "tx_mcs": AttributeMapping([("tx", "mcs")], _get_nested_value),
-    "tx_40mhz": AttributeMapping([("tx", "40mhz")], _get_nested_value),
-    "tx_short_gi": AttributeMapping([("tx", "short_gi")], _get_nested_value),
-    "tx_failed": AttributeMapping([("tx", "failed")], _get_nested_value),
-    "tx_retries": AttributeMapping([("tx", "retries")], _get_nested_value),
+    **{
+        f"{direction}_{key}": AttributeMapping([(direction, key)], _get_nested_value)
+        for direction in ("rx", "tx")
+        for key in _LINK_ATTRIBUTE_KEYS
+    },
+    **{f"tx_{key}": AttributeMapping([("tx", key)], _get_nested_value) for key in _TX_ATTRIBUTE_KEYS},
 }
 # Device statistics sensor descriptions (per connected device)
-SENSOR_DESCRIPTIONS = [
+SENSOR_DESCRIPTIONS = (
     SensorEntityDescription(
         key="signal",
         name="Signal Strength",
@@ -330,7 +358,130 @@ SENSOR_DESCRIPTIONS = [
         icon="mdi:wifi",
         entity_category=None,
     ),
-]
+)
+
+
+def _convert_sensor_values(device_data: dict) -> dict[str, Any]:
+    """Convert the values of every sensor of a device that needs no history.
+
+    Speed sensors depend on the previous sample and are left to SpeedTracker.
+    """
+    values = {}
+    for key, mapping in SENSOR_VALUE_MAPPING.items():
+        if mapping.needs_history:
+            continue
+        if not _has_required_data(device_data, mapping.data_keys):
+            values[key] = mapping.default_value
+            continue
+        try:
+            values[key] = mapping.convert_function(device_data, mapping.data_keys)
+        except (KeyError, TypeError, ValueError) as exc:
+            _LOGGER.debug("Error converting %s: %s", key, exc)
+            values[key] = mapping.default_value
+    return values
+
+
+# (description, unique_id suffix) pairs, so discovery only concatenates strings
+_UNIQUE_ID_SUFFIXES = tuple((description, f"_{description.key}") for description in SENSOR_DESCRIPTIONS)
+
+
+def _statistics_fingerprint(device_stats: dict[str, dict]) -> tuple:
+    """Summarize device statistics by device, connected time and byte counters.
+
+    Every fetch from the router moves the connected time of each device, so an
+    unchanged fingerprint means the statistics were served from the cache.
+    """
+    return tuple(
+        (
+            mac_address,
+            device_data.get("connected_time"),
+            (device_data.get("rx") or {}).get("bytes"),
+            (device_data.get("tx") or {}).get("bytes"),
+        )
+        for mac_address, device_data in device_stats.items()
+    )
+
+
+class DeviceStatisticsCoordinator(SharedDataUpdateCoordinator):
+    """Coordinator of the connected wireless device statistics."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the coordinator."""
+        super().__init__(*args, **kwargs)
+        # Converted sensor values per device, rebuilt only when the statistics change
+        self.sensor_values: dict[str, dict[str, Any]] = {}
+        # State attributes per device, built by the first sensor that needs them
+        self.device_attributes: dict[str, _DeviceAttributes] = {}
+        # Byte counters of the previous refresh per device, for the speed sensors
+        self.speed_trackers: dict[str, SpeedTracker] = {}
+        # Device statistics of the last refresh, keyed by MAC address
+        self.stats_snapshot: dict[str, dict[str, Any]] = {}
+        # Device info per device, shared by all sensors of that device
+        self.device_infos: dict[str, DeviceInfo] = {}
+        # Configured interval and the number of refreshes in a row without changes
+        self._base_update_interval = self.update_interval
+        self._idle_cycles = 0
+        # Fingerprint of the statistics the current data was built from
+        self._last_fp: tuple | None = None
+        # Time of the last real fetch by the data manager, and the traffic it reported
+        self._last_fetch_time: datetime | None = None
+        self._last_activity: tuple | None = None
+
+    async def _async_update_data(self):
+        """Fetch device statistics, keeping the previous data if nothing changed."""
+        data = await super()._async_update_data()
+        device_stats = (data or {}).get("device_statistics") or {}
+
+        # Hand out the previous object when the router reports the same statistics,
+        # so everything keyed on the data object stays valid. Comparing a small
+        # fingerprint is cheaper than comparing the whole payload.
+        fingerprint = _statistics_fingerprint(device_stats)
+
+        # Only a real fetch by the data manager tells whether the clients are idle,
+        # a cache hit hands out the same statistics again
+        fetch_time = self.data_manager.get_last_update("device_statistics")
+        if fetch_time != self._last_fetch_time:
+            self._last_fetch_time = fetch_time
+            # Connected time moves on every fetch, only traffic counts as activity
+            activity = tuple(
+                (mac_address, rx_bytes, tx_bytes)
+                for mac_address, _connected_time, rx_bytes, tx_bytes in fingerprint
+            )
+            if activity == self._last_activity:
+                # Poll less often while nothing changes, up to 8 times the configured interval
+                self._idle_cycles += 1
+                self.update_interval = self._base_update_interval * (
+                    2 ** min(self._idle_cycles, _MAX_IDLE_BACKOFF)
+                )
+            elif self._idle_cycles:
+                self._idle_cycles = 0
+                self.update_interval = self._base_update_interval
+            self._last_activity = activity
+
+        if self.data is not None and fingerprint == self._last_fp:
+            return self.data
+
+        self._last_fp = fingerprint
+        self.stats_snapshot = device_stats
+
+        # One speed sample per device and refresh, both speed sensors read it.
+        # Trackers of devices that left are dropped.
+        current_time = time.time()
+        speed_trackers = {}
+        sensor_values = {}
+        for mac_address, device_data in device_stats.items():
+            tracker = speed_trackers[mac_address] = self.speed_trackers.get(mac_address) or SpeedTracker()
+            values = sensor_values[mac_address] = _convert_sensor_values(device_data)
+            values["rx_speed"], values["tx_speed"] = tracker.update(device_data, current_time)
+        self.speed_trackers = speed_trackers
+        self.sensor_values = sensor_values
+        # Attributes of devices that left are not needed anymore
+        self.device_attributes = {
+            mac_address: device_attributes
+            for mac_address, device_attributes in self.device_attributes.items()
+            if mac_address in device_stats
+        }
+        return data
 
 
 async def _migrate_sta_sensor_unique_ids(
@@ -416,7 +567,7 @@ async def async_setup_entry(
         hass: HomeAssistant,
         entry: ConfigEntry,
         async_add_entities: AddEntitiesCallback,
-) -> SharedDataUpdateCoordinator:
+) -> DeviceStatisticsCoordinator:
     """Set up the device statistics sensors from a config entry."""
 
     # Get shared data manager
@@ -437,12 +588,14 @@ async def async_setup_entry(
     await _migrate_sta_sensor_unique_ids(hass, entry, tracking_method)
 
     # Create coordinator using shared data manager
-    coordinator = SharedDataUpdateCoordinator(
+    coordinator = DeviceStatisticsCoordinator(
         hass,
         data_manager,
         ["device_statistics"],  # Data types this coordinator needs
         f"{DOMAIN}_devices_{entry.data[CONF_HOST]}",
         scan_interval,
+        # Unchanged statistics come back as the same object, skip notifying the sensors
+        always_update=False,
     )
 
     # Store known devices for dynamic entity creation
@@ -458,104 +611,88 @@ async def async_setup_entry(
         hass.data[DOMAIN][sta_coordinators_key][entry.entry_id] = coordinator
         _LOGGER.debug("Stored STA sensor coordinator for %s (tracking_method=uniqueid)", entry.data[CONF_HOST])
 
+    # Unique_id prefix matching the format used by DeviceStatisticsSensor
+    if tracking_method == "uniqueid":
+        unique_id_prefix = "sensor_"
+    else:
+        unique_id_prefix = f"{entry.data[CONF_HOST]}_sensor_"
+
     # Add update listener for dynamic device creation
-    async def _handle_coordinator_update_async():
+    # Nothing in here awaits, so it runs directly in the listener instead of in a task
+    @callback
+    def _handle_coordinator_update():
         """Handle coordinator updates and create new entities for new devices."""
         if not coordinator.data or "device_statistics" not in coordinator.data:
             return
 
-        device_stats = coordinator.data["device_statistics"]
-        current_devices = set(device_stats.keys())
+        device_stats = coordinator.stats_snapshot
+        current_devices = device_stats.keys()
+
+        # Handle removed devices - forget them, so they are set up again when they return
+        coordinator.known_devices &= current_devices
 
         # Handle new devices
         new_devices = current_devices - coordinator.known_devices
         if new_devices:
             _LOGGER.info("Found %d new STA devices: %s", len(new_devices), new_devices)
 
-            # Get entity registry to check for existing entities
+            # Snapshot the registered STA sensor unique_ids once, instead of looking up
+            # every (device, sensor) pair in the entity registry.
             entity_registry = er.async_get(hass)
-
-            new_entities = []
-            for mac_address in new_devices:
-                # Check each sensor type for this device
-                device_sensors_to_add = []
-                for description in SENSOR_DESCRIPTIONS:
-                    # Build unique_id matching the format used by DeviceStatisticsSensor
-                    if tracking_method == "uniqueid":
-                        unique_id = f"sensor_{mac_address}_{description.key}"
-                    else:
-                        unique_id = f"{entry.data[CONF_HOST]}_sensor_{mac_address}_{description.key}"
-
-                    existing_entity_id = entity_registry.async_get_entity_id(
-                        "sensor", DOMAIN, unique_id
-                    )
-
-                    if existing_entity_id:
-                        _LOGGER.debug(
-                            "STA sensor entity %s already exists with entity_id %s, skipping creation",
-                            unique_id, existing_entity_id
-                        )
-                        continue
-
-                    # Check if sensor has required data
-                    device_data = device_stats.get(mac_address, {})
-                    mapping = SENSOR_VALUE_MAPPING.get(description.key)
-                    if mapping and _has_required_data(device_data, mapping.data_keys):
-                        device_sensors_to_add.append(description)
-
-                # Only add sensors that don't already exist and have data
-                if device_sensors_to_add:
-                    new_entities.extend([
-                        DeviceStatisticsSensor(coordinator, description, mac_address)
-                        for description in device_sensors_to_add
-                    ])
-
-                coordinator.known_devices.add(mac_address)
+            if tracking_method == "uniqueid":
+                # The sensors of a roaming device may belong to another router's entry,
+                # so every entity of the registry has to be checked
+                registry_entries = entity_registry.entities.values()
+            else:
+                registry_entries = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+            existing_unique_ids = {
+                entity_entry.unique_id
+                for entity_entry in registry_entries
+                if entity_entry.domain == "sensor"
+                and entity_entry.platform == DOMAIN
+                and entity_entry.unique_id.startswith(unique_id_prefix)
+            }
+
+            # Only add sensors that don't already exist and have data
+            new_entities = [
+                DeviceStatisticsSensor(coordinator, description, mac_address)
+                for mac_address in new_devices
+                for description, unique_id_suffix in _UNIQUE_ID_SUFFIXES
+                if unique_id_prefix + mac_address + unique_id_suffix not in existing_unique_ids
+                and _has_required_data(device_stats[mac_address], SENSOR_VALUE_MAPPING[description.key].data_keys)
+            ]
+            coordinator.known_devices |= new_devices
 
             # Add new entities only if there are any
             if new_entities:
-                async_add_entities(new_entities, True)
+                async_add_entities(new_entities)
                 _LOGGER.info("Created %d STA sensor entities for %d new devices",
                              len(new_entities), len(new_devices))
             else:
                 _LOGGER.debug("No new STA sensor entities to create for %d devices (all already exist or no data)",
                               len(new_devices))
 
-        # Handle removed devices - remove entities for devices that no longer exist
-        if removed_devices := coordinator.known_devices - current_devices:
-            for mac_address in removed_devices:
-                coordinator.known_devices.discard(mac_address)
-
-
     # Perform first refresh
     await coordinator.async_config_entry_first_refresh()
 
     # Add initial sensors for any devices already discovered
     initial_entities = []
-    if coordinator.data and coordinator.data.get("device_statistics"):
-        device_stats = coordinator.data["device_statistics"]
-        for mac_address in device_stats:
-            coordinator.known_devices.add(mac_address)
-            device_data = device_stats[mac_address]
-
-            # Only add sensors that have the required data
-            for description in SENSOR_DESCRIPTIONS:
-                mapping = SENSOR_VALUE_MAPPING.get(description.key)
-                if mapping and _has_required_data(device_data, mapping.data_keys):
-                    initial_entities.append(
-                        DeviceStatisticsSensor(coordinator, description, mac_address)
-                    )
+    if device_stats := coordinator.stats_snapshot:
+        coordinator.known_devices |= device_stats.keys()
+
+        # Only add sensors that have the required data
+        initial_entities = [
+            DeviceStatisticsSensor(coordinator, description, mac_address)
+            for mac_address, device_data in device_stats.items()
+            for description in SENSOR_DESCRIPTIONS
+            if _has_required_data(device_data, SENSOR_VALUE_MAPPING[description.key].data_keys)
+        ]
 
     # Add initial entities if any
     if initial_entities:
-        async_add_entities(initial_entities, True)
+        async_add_entities(initial_entities)
         _LOGGER.info("Set up %d initial STA statistics sensors", len(initial_entities))
 
-    # Create sync wrapper for async coordinator update handler
-    def _handle_coordinator_update():
-        """Sync wrapper for async coordinator update handler."""
-        hass.async_create_task(_handle_coordinator_update_async())
-
     # Register the update listener
     coordinator.async_add_listener(_handle_coordinator_update)
 
@@ -566,42 +703,58 @@ async def async_setup_entry(
 class DeviceStatisticsSensor(CoordinatorEntity, SensorEntity):
     """Representation of a device statistics sensor."""
 
+    # Own per-entity fields. Home Assistant base classes keep a __dict__,
+    # so the _attr_* attributes stay there.
+    __slots__ = (
+        "_key",
+        "_mac_address",
+        "_host",
+        "_tracking_method",
+        "_value_mapping",
+        "_default_value",
+    )
+
     def __init__(
             self,
-            coordinator: SharedDataUpdateCoordinator,
+            coordinator: DeviceStatisticsCoordinator,
             description: SensorEntityDescription,
             mac_address: str,
     ) -> None:
         """Initialize the device statistics sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._mac_address = mac_address
-        self._host = coordinator.data_manager.entry.data[CONF_HOST]
+        # Sensor key, read on every state write instead of going through entity_description
+        self._key = description.key
+        # Interned like the device_statistics keys, so lookups compare by identity
+        self._mac_address = sys.intern(mac_address)
+        self._host = coordinator.host
         self._tracking_method = coordinator.tracking_method
 
         # Use sensor-specific unique ID pattern to avoid collision with device tracker
         # For uniqueid tracking, don't include host to allow roaming between APs
         # For combined tracking, include host to keep sensors per AP
         if self._tracking_method == "uniqueid":
-            self._attr_unique_id = f"sensor_{mac_address}_{description.key}"
+            self._attr_unique_id = f"sensor_{mac_address}_{self._key}"
         else:
-            self._attr_unique_id = f"{self._host}_sensor_{mac_address}_{description.key}"
+            self._attr_unique_id = f"{self._host}_sensor_{mac_address}_{self._key}"
 
         self._attr_has_entity_name = True
 
-        # Store previous data for speed calculations
-        self._previous_rx_bytes = None
-        self._previous_tx_bytes = None
-        self._previous_update_time = None
+        # Value mapping of this sensor, resolved once instead of on every read
+        self._value_mapping = SENSOR_VALUE_MAPPING.get(self._key)
+        self._default_value = self._value_mapping.default_value if self._value_mapping else None
 
-    def _device_data(self) -> dict[str, Any] | None:
-        """Get device data, searching all coordinators for uniqueid tracking."""
-        device_stats = self.coordinator.data.get("device_statistics", {})
+    def _find_device(self) -> tuple[DeviceStatisticsCoordinator | None, dict[str, Any] | None]:
+        """Get the coordinator reporting the device and its data.
+
+        For uniqueid tracking all coordinators are searched if the device is not found locally.
+        """
+        device_stats = self.coordinator.stats_snapshot
         device_data = device_stats.get(self._mac_address) or device_stats.get(self._mac_address.upper())
 
         # For combined tracking or if found locally, return immediately
         if self._tracking_method == "combined" or device_data:
-            return device_data
+            return self.coordinator, device_data
 
         # For uniqueid tracking, search in all coordinators if not found locally
         if self._tracking_method == "uniqueid":
@@ -613,18 +766,18 @@ class DeviceStatisticsSensor(CoordinatorEntity, SensorEntity):
                 if other_coordinator == self.coordinator:
                     continue
 
-                # Check if coordinator has data
-                if not other_coordinator.data:
-                    continue
-
                 # Look for device in this coordinator's data
-                other_stats = other_coordinator.data.get("device_statistics", {})
+                other_stats = other_coordinator.stats_snapshot
                 device_data = other_stats.get(self._mac_address) or other_stats.get(self._mac_address.upper())
 
                 if device_data:
-                    return device_data
+                    return other_coordinator, device_data
 
-        return None
+        return None, None
+
+    def _device_data(self) -> dict[str, Any] | None:
+        """Get device data, searching all coordinators for uniqueid tracking."""
+        return self._find_device()[1]
 
     def _get_device_data_with_host(self) -> tuple[dict | None, str | None]:
         """Get device data and the host where it was found.
@@ -632,36 +785,10 @@ class DeviceStatisticsSensor(CoordinatorEntity, SensorEntity):
         Returns:
             Tuple of (device_data, host) where device was found, or (None, None) if not found.
         """
-        device_stats = self.coordinator.data.get("device_statistics", {})
-        device_data = device_stats.get(self._mac_address) or device_stats.get(self._mac_address.upper())
-
-        # For combined tracking or if found locally, return immediately
-        if self._tracking_method == "combined" or device_data:
-            return device_data, self._host
-
-        # For uniqueid tracking, search in all coordinators if not found locally
-        if self._tracking_method == "uniqueid":
-            sta_coordinators_key = "sta_sensor_coordinators"
-            all_coordinators = self.hass.data.get(DOMAIN, {}).get(sta_coordinators_key, {})
-
-            for entry_id, other_coordinator in all_coordinators.items():
-                # Skip the coordinator we already checked
-                if other_coordinator == self.coordinator:
-                    continue
-
-                # Check if coordinator has data
-                if not other_coordinator.data:
-                    continue
-
-                # Look for device in this coordinator's data
-                other_stats = other_coordinator.data.get("device_statistics", {})
-                device_data = other_stats.get(self._mac_address) or other_stats.get(self._mac_address.upper())
-
-                if device_data:
-                    other_host = other_coordinator.data_manager.entry.data[CONF_HOST]
-                    return device_data, other_host
-
-        return None, None
+        coordinator, device_data = self._find_device()
+        if device_data is None:
+            return None, None
+        return device_data, coordinator.host
 
     @property
     def device_info(self) -> DeviceInfo | None:
@@ -670,20 +797,36 @@ class DeviceStatisticsSensor(CoordinatorEntity, SensorEntity):
         if device_data := self._device_data():
             ap_device = device_data.get("ap_device", "Unknown AP")
 
+        name = self._get_device_name()
+
+        # For uniqueid tracking, don't set via_device since device can roam between APs
+        # For combined tracking, set via_device to local AP
+        via_device = None
+        if self._tracking_method == "combined" and ap_device != "Unknown AP":
+            via_device = (DOMAIN, f"{self._host}_ap_{ap_device}")
+
+        # Reuse the device info built by another sensor of this device while it still matches
+        device_infos = self.coordinator.device_infos
+        device_info = device_infos.get(self._mac_address)
+        if (
+                device_info is not None
+                and device_info["name"] == name
+                and device_info.get("via_device") == via_device
+        ):
+            return device_info
+
         device_info_dict = {
             "identifiers": {(DOMAIN, self._mac_address)},
-            "name": self._get_device_name(),
+            "name": name,
             "manufacturer": "Unknown",
             "model": "WiFi Device",
             "connections": {("mac", self._mac_address)},
         }
+        if via_device is not None:
+            device_info_dict["via_device"] = via_device
 
-        # For uniqueid tracking, don't set via_device since device can roam between APs
-        # For combined tracking, set via_device to local AP
-        if self._tracking_method == "combined" and ap_device != "Unknown AP":
-            device_info_dict["via_device"] = (DOMAIN, f"{self._host}_ap_{ap_device}")
-
-        return DeviceInfo(**device_info_dict)
+        device_info = device_infos[self._mac_address] = DeviceInfo(**device_info_dict)
+        return device_info
 
     def _get_device_name(self) -> str:
         """Get the device name from coordinator data or fallback to MAC."""
@@ -715,7 +858,7 @@ class DeviceStatisticsSensor(CoordinatorEntity, SensorEntity):
 
         # Check if sensor has the required data to show a value
         if device_data := self._device_data():
-            mapping = SENSOR_VALUE_MAPPING.get(self.entity_description.key)
+            mapping = self._value_mapping
             if not mapping:
                 return False
 
@@ -727,29 +870,35 @@ class DeviceStatisticsSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> str | int | float | bool | None:
         """Return the state of the sensor."""
-        device_data = self._device_data()
+        coordinator, device_data = self._find_device()
         if device_data is None:
             return None
-        key = self.entity_description.key
 
-        # Get value mapping for this sensor
-        mapping = SENSOR_VALUE_MAPPING.get(key)
+        mapping = self._value_mapping
         if not mapping:
             return None
 
+        # Values were converted once per refresh by the coordinator
+        device_values = (
+            coordinator.sensor_values.get(self._mac_address)
+            or coordinator.sensor_values.get(self._mac_address.upper())
+        )
+        if device_values is not None and self._key in device_values:
+            return device_values[self._key]
+
+        # Speeds only exist in the coordinator's values, they need the previous sample
+        if mapping.needs_history:
+            return self._default_value
+
         # Check if any required keys exist in data
         if not _has_required_data(device_data, mapping.data_keys):
-            return mapping.default_value
+            return self._default_value
 
         try:
-            # For speed calculations, pass the sensor instance
-            if key in ["rx_speed", "tx_speed"]:
-                return mapping.convert_function(device_data, mapping.data_keys, self)
-            else:
-                return mapping.convert_function(device_data, mapping.data_keys)
+            return mapping.convert_function(device_data, mapping.data_keys, self)
         except (KeyError, TypeError, ValueError) as exc:
-            _LOGGER.debug("Error getting %s for %s: %s", key, self._mac_address, exc)
-            return mapping.default_value
+            _LOGGER.debug("Error getting %s for %s: %s", self._key, self._mac_address, exc)
+            return self._default_value
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -762,26 +911,49 @@ class DeviceStatisticsSensor(CoordinatorEntity, SensorEntity):
         # Use the host where device was actually found (dynamic for uniqueid tracking)
         router_host = current_host if current_host else self._host
 
-        attributes = {
-            "mac_address": self._mac_address,
-            "router": router_host,
-            "last_update": self.coordinator.last_update_success,
-            "ap_device": device_data.get("ap_device", "Unknown AP"),
-            "ap_ssid": device_data.get("ap_ssid", "Unknown SSID"),
-        }
+        # The data manager hands out the same device dict until it refetches it,
+        # so identical source objects mean identical attributes. All sensors of
+        # the device share them through the coordinator.
+        last_update = self.coordinator.last_update_success
+        device_attributes_cache = self.coordinator.device_attributes
+        device_attributes = device_attributes_cache.get(self._mac_address)
+        if (
+                device_attributes is None
+                or device_attributes.device_data is not device_data
+                or device_attributes.router_host != router_host
+                or device_attributes.last_update != last_update
+        ):
+            device_attributes = device_attributes_cache[self._mac_address] = _DeviceAttributes(
+                device_data,
+                router_host,
+                last_update,
+                {
+                    "mac_address": self._mac_address,
+                    "router": router_host,
+                    "last_update": last_update,
+                    "ap_device": device_data.get("ap_device", "Unknown AP"),
+                    "ap_ssid": device_data.get("ap_ssid", "Unknown SSID"),
+                },
+            )
 
         # Add extra technical attributes ONLY to signal_strength sensor
-        if self.entity_description.key == "signal":
-            # Add extra attributes using mapping
-            for attr_key, mapping in EXTRA_ATTRIBUTES_MAPPING.items():
-                try:
-                    # Check if required data exists
-                    if _has_required_data(device_data, mapping.data_keys):
-                        value = mapping.convert_function(device_data, mapping.data_keys)
-                        if value is not None:  # Only add attribute if value is not None
-                            attributes[attr_key] = value
-                except (KeyError, TypeError, ValueError) as exc:
-                    _LOGGER.debug("Error getting attribute %s for %s: %s", attr_key, self._mac_address, exc)
-                    continue
-
+        if self._key != "signal":
+            return device_attributes.base
+        if device_attributes.signal is not None:
+            return device_attributes.signal
+
+        attributes = dict(device_attributes.base)
+        # Add extra attributes using mapping
+        for attr_key, mapping in EXTRA_ATTRIBUTES_MAPPING.items():
+            try:
+                # Check if required data exists
+                if _has_required_data(device_data, mapping.data_keys):
+                    value = mapping.convert_function(device_data, mapping.data_keys)
+                    if value is not None:  # Only add attribute if value is not None
+                        attributes[attr_key] = value
+            except (KeyError, TypeError, ValueError) as exc:
+                _LOGGER.debug("Error getting attribute %s for %s: %s", attr_key, self._mac_address, exc)
+                continue
+
+        device_attributes.signal = attributes
         return attributes
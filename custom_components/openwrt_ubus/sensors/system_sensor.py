@@ -287,7 +287,7 @@ class SystemInfoSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._host = coordinator.data_manager.entry.data[CONF_HOST]
+        self._host = coordinator.host
         self._attr_unique_id = f"{self._host}_{description.key}"
         self._attr_has_entity_name = True
         self.cpu_idle = None
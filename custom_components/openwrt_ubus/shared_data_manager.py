@@ -4,16 +4,20 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any, Dict
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
+    API_CONNECTIONS_PER_HOST,
+    API_KEEPALIVE_TIMEOUT,
     CONF_DHCP_SOFTWARE,
     CONF_WIRELESS_SOFTWARE,
     CONF_SYSTEM_SENSOR_TIMEOUT,
@@ -88,7 +92,9 @@ class SharedUbusDataManager:
 
         # Initialize ubus clients
         self._ubus_clients: Dict[str, ExtendedUbus] = {}
+        self._client_lock = asyncio.Lock()  # Serializes client creation and login
         self._session = None
+        self._unsub_session_close = None
 
     def logout(self):
         """Logout all ubus clients."""
@@ -97,26 +103,44 @@ class SharedUbusDataManager:
 
     async def _get_ubus_client(self, client_type: str = "default") -> ExtendedUbus:
         """Get or create ubus client instance."""
-        if client_type not in self._ubus_clients:
-            if self._session is None:
-                self._session = async_get_clientsession(self.hass)
+        client = self._ubus_clients.get(client_type)
+        if client is not None:
+            return client
+
+        # Coordinators refresh concurrently, make sure only one of them logs in
+        async with self._client_lock:
+            if client_type not in self._ubus_clients:
+                if self._session is None:
+                    # Own session so idle connections to the router outlive the
+                    # poll interval instead of being re-established on every poll
+                    self._session = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(
+                            keepalive_timeout=API_KEEPALIVE_TIMEOUT,
+                            limit_per_host=API_CONNECTIONS_PER_HOST,
+                        )
+                    )
+                    # Not one of Home Assistant's sessions, so close it on shutdown
+                    # ourselves in case the entry is never unloaded
+                    self._unsub_session_close = self.hass.bus.async_listen_once(
+                        EVENT_HOMEASSISTANT_CLOSE, self._async_close_session
+                    )
 
-            url = f"http://{self.entry.data[CONF_HOST]}/ubus"
-            username = self.entry.data[CONF_USERNAME]
-            password = self.entry.data[CONF_PASSWORD]
+                url = f"http://{self.entry.data[CONF_HOST]}/ubus"
+                username = self.entry.data[CONF_USERNAME]
+                password = self.entry.data[CONF_PASSWORD]
 
-            # Use ExtendedUbus for all client types now
-            client = ExtendedUbus(url, username, password, session=self._session)
+                # Use ExtendedUbus for all client types now
+                client = ExtendedUbus(url, username, password, session=self._session)
 
-            # Connect to the client
-            try:
-                session_id = await client.connect()
-                if session_id is None:
-                    raise UpdateFailed(f"Failed to connect to OpenWrt device")
-                self._ubus_clients[client_type] = client
-            except Exception as exc:
-                _LOGGER.error("Failed to connect ubus client %s: %s", client_type, exc)
-                raise UpdateFailed(f"Failed to connect ubus client {client_type}: {exc}")
+                # Connect to the client
+                try:
+                    session_id = await client.connect()
+                    if session_id is None:
+                        raise UpdateFailed(f"Failed to connect to OpenWrt device")
+                    self._ubus_clients[client_type] = client
+                except Exception as exc:
+                    _LOGGER.error("Failed to connect ubus client %s: %s", client_type, exc)
+                    raise UpdateFailed(f"Failed to connect ubus client {client_type}: {exc}")
 
         return self._ubus_clients[client_type]
 
@@ -250,11 +274,12 @@ class SharedUbusDataManager:
         dhcp_software = self.entry.data.get(CONF_DHCP_SOFTWARE, "dnsmasq")
 
         try:
-            # Get MAC to name/IP mapping (includes /etc/ethers)
-            mac2name = await self._get_mac2name_mapping(dhcp_software)
-
-            # Get interface to SSID mapping
-            interface_to_ssid = await self._get_interface_to_ssid_mapping()
+            # Get MAC to name/IP mapping (includes /etc/ethers) and interface
+            # to SSID mapping, they are independent so fetch them concurrently
+            mac2name, interface_to_ssid = await asyncio.gather(
+                self._get_mac2name_mapping(dhcp_software),
+                self._get_interface_to_ssid_mapping(),
+            )
 
             # Get device statistics and connection info
             if wireless_software == "hostapd":
@@ -301,7 +326,8 @@ class SharedUbusDataManager:
                     sta_stats = {}
 
                 for mac in sta_devices:
-                    normalized_mac = mac.upper()
+                    # Interned, sensors look their device up with the same string object
+                    normalized_mac = sys.intern(mac.upper())
                     # Get hostname from ethers or DHCP, fallback to MAC if not found
                     hostname_data = mac2name.get(normalized_mac, {})
                     hostname = hostname_data.get("hostname", normalized_mac.replace(":", ""))
@@ -377,7 +403,8 @@ class SharedUbusDataManager:
                     sta_stats = {}
 
                 for mac in sta_devices:
-                    normalized_mac = mac.upper()
+                    # Interned, sensors look their device up with the same string object
+                    normalized_mac = sys.intern(mac.upper())
 
                     # Get hostname from ethers or DHCP
                     hostname_data = mac2name.get(normalized_mac, {})
@@ -517,7 +544,8 @@ class SharedUbusDataManager:
             result = await client.get_network_devices()
 
             # Debug log the raw response
-            _LOGGER.debug("Raw network devices response: %s", result)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Raw network devices response: %s", result)
 
             # Handle different response formats
             if isinstance(result, dict) and "values" in result:
@@ -544,7 +572,17 @@ class SharedUbusDataManager:
                 _LOGGER.error("Invalid network devices data: %s", network_devices)
                 return {"network_devices": {}}
 
-            return {"network_devices": network_devices}
+            # Validate the entries once here; sensors share the snapshot
+            # read-only and don't need to re-check it on every update
+            validated = {}
+            for device_name, device_data in network_devices.items():
+                if not isinstance(device_data, dict):
+                    continue
+                speed = device_data.get("speed")
+                if isinstance(speed, str) and speed.endswith("F"):
+                    device_data["speed"] = speed[:-1]  # Remove 'F' suffix (e.g. "1000F" -> "1000")
+                validated[device_name] = device_data
+            return {"network_devices": MappingProxyType(validated)}
 
         except Exception as exc:
             _LOGGER.error("Error fetching network devices: %s", exc, exc_info=True)
@@ -695,12 +733,30 @@ class SharedUbusDataManager:
                 _LOGGER.debug("Error closing ubus client: %s", exc)
         self._ubus_clients.clear()
 
+        if self._unsub_session_close is not None:
+            self._unsub_session_close()
+            self._unsub_session_close = None
+        await self._async_close_session()
+
+    async def _async_close_session(self, event: Event | None = None) -> None:
+        """Close the HTTP session to the router."""
+        if event is not None:
+            # async_listen_once already removed the listener
+            self._unsub_session_close = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     def set_update_interval(self, data_type: str, interval: timedelta):
         """Set custom update interval for a data type."""
         self._update_intervals[data_type] = interval
         if data_type not in self._update_locks:
             self._update_locks[data_type] = asyncio.Lock()
 
+    def get_last_update(self, data_type: str) -> datetime | None:
+        """Return when a data type was last fetched from the router."""
+        return self._last_update.get(data_type)
+
     def invalidate_cache(self, data_type: str = None):
         """Invalidate cache for specific data type or all data."""
         if data_type:
@@ -734,6 +790,7 @@ class SharedDataUpdateCoordinator(DataUpdateCoordinator):
             data_types: list[str],
             name: str,
             update_interval: timedelta,
+            always_update: bool = True,
     ):
         """Initialize the coordinator."""
         super().__init__(
@@ -741,9 +798,12 @@ class SharedDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=name,
             update_interval=update_interval,
+            always_update=always_update,
         )
         self.data_manager = data_manager
         self.data_types = data_types
+        # Router host, read by entities instead of walking data_manager.entry.data
+        self.host = data_manager.entry.data[CONF_HOST]
 
     async def _async_update_data(self):
         """Fetch data using shared manager."""
@@ -0,0 +1,46 @@
+"""Tests for the ubus client."""
+
+import asyncio
+
+import pytest
+
+from custom_components.openwrt_ubus.Ubus.interface import Ubus
+
+
+def test_cancelled_leader_does_not_cancel_follower():
+    """A follower sharing an in-flight call still gets its result when the first caller is cancelled."""
+
+    async def run():
+        ubus = Ubus("http://192.168.1.1/ubus", "root", "password")
+        started = asyncio.Event()
+        release = asyncio.Event()
+        calls = 0
+
+        async def ensure_session_is_valid():
+            pass
+
+        async def api_call(rpc_method, subsystem, method, params):
+            nonlocal calls
+            calls += 1
+            started.set()
+            await release.wait()
+            return {"model": "test"}
+
+        ubus._ensure_session_is_valid = ensure_session_is_valid
+        ubus._api_call = api_call
+
+        leader = asyncio.create_task(ubus.api_call("call", "system", "board"))
+        await started.wait()
+        follower = asyncio.create_task(ubus.api_call("call", "system", "board"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        release.set()
+        assert await follower == {"model": "test"}
+        assert calls == 1
+        assert not ubus._inflight
+
+    asyncio.run(run())